@@ -2,7 +2,7 @@ from fastapi import Header, HTTPException, status
 from app.config import settings
 
 
-async def verify_api_key(x_api_key: str = Header(...)):
+async def verify_api_key(x_api_key: str = Header(...)) -> str:
     if not x_api_key or x_api_key not in settings.allowed_api_keys:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
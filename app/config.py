@@ -1,5 +1,6 @@
+from pydantic import PrivateAttr
 from pydantic_settings import BaseSettings, SettingsConfigDict
-from typing import List
+from typing import Any, FrozenSet
 
 
 class Settings(BaseSettings):
@@ -15,6 +16,8 @@ class Settings(BaseSettings):
     # PredixionAI Voice settings
     predixionai_api_url: str = "http://localhost:8000"
     predixionai_api_key: str = ""
+    # Send caller audio as raw PCM binary frames (server must accept them)
+    predixionai_binary_audio: bool = False
 
     # Twilio settings (optional)
     twilio_account_sid: str = ""
@@ -37,13 +40,23 @@ class Settings(BaseSettings):
         case_sensitive=False
     )
 
+    # Derived values are computed once at load time; settings never change at runtime
+    _allowed_api_keys: FrozenSet[str] = PrivateAttr(default_factory=frozenset)
+    _is_development: bool = PrivateAttr(default=False)
+
+    def model_post_init(self, __context: Any) -> None:
+        self._allowed_api_keys = frozenset(
+            key.strip() for key in self.api_keys.split(",") if key.strip()
+        )
+        self._is_development = self.environment.lower() == "development"
+
     @property
-    def allowed_api_keys(self) -> List[str]:
-        return [key.strip() for key in self.api_keys.split(",") if key.strip()]
+    def allowed_api_keys(self) -> FrozenSet[str]:
+        return self._allowed_api_keys
 
     @property
     def is_development(self) -> bool:
-        return self.environment.lower() == "development"
+        return self._is_development
 
 
 settings = Settings()
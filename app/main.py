@@ -1,13 +1,15 @@
 import logging
-from fastapi import FastAPI, Request
-from fastapi.responses import JSONResponse
+import orjson
+from fastapi import FastAPI, Request, Response
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 from app.config import settings
 from app.routers import webhooks, dialer
 from app.models import ErrorResponse
 from app.services.dialers.registry import DialerRegistry
 from app.services.dialers.twilio.service import TwilioDialerService
 from app.services.agents.registry import AgentRegistry
+from app.services.agents.base import HTTP2_AVAILABLE
 from app.services.agents.elevenlabs.service import ElevenLabsAgentService
 from app.services.agents.predixionai.service import PredixionAIAgentService
 
@@ -24,6 +26,8 @@ app = FastAPI(
     version="1.0.0",
     docs_url="/docs" if settings.is_development else None,
     redoc_url="/redoc" if settings.is_development else None,
+    # Serialize JSON responses with orjson, the same encoder the media streams use
+    default_response_class=ORJSONResponse,
 )
 
 if settings.is_development:
@@ -64,39 +68,71 @@ async def startup_event():
     logger.info(f"Registered Dialers: {', '.join(DialerRegistry.list_dialers())}")
     logger.info(f"Default Agent: {settings.default_agent}")
     logger.info(f"Registered Agents: {', '.join(AgentRegistry.list_agents())}")
+    if not HTTP2_AVAILABLE:
+        logger.warning("h2 not installed; agent HTTP clients use HTTP/1.1 (install httpx[http2])")
     logger.info("=" * 60)
 
+    # Build the shared plugin instances up front so requests never pay for it
+    for dialer_name in DialerRegistry.list_dialers():
+        DialerRegistry.get_instance(dialer_name)
+    for agent_name in AgentRegistry.list_agents():
+        AgentRegistry.get_instance(agent_name)
+
 
 @app.on_event("shutdown")
 async def shutdown_event():
     logger.info("ElevenLabs Agent Connector Shutting Down")
+    await AgentRegistry.aclose_all()
 
 
-@app.exception_handler(Exception)
-async def global_exception_handler(request: Request, exc: Exception):
-    logger.error(f"Unhandled exception: {str(exc)}", exc_info=True)
-
+def _internal_error_response(detail: str) -> Response:
     error_response = ErrorResponse(
         error="Internal server error",
-        detail=str(exc) if settings.is_development else "An unexpected error occurred"
+        detail=detail
     )
 
-    return JSONResponse(
-        status_code=500,
-        content=error_response.model_dump()
+    return Response(
+        content=error_response.model_dump_json(),
+        media_type="application/json",
+        status_code=500
     )
 
 
-@app.get("/")
-async def root():
-    return {
+async def development_exception_handler(request: Request, exc: Exception):
+    logger.error(f"Unhandled exception: {str(exc)}", exc_info=True)
+    return _internal_error_response(str(exc))
+
+
+async def production_exception_handler(request: Request, exc: Exception):
+    logger.error(f"Unhandled exception: {str(exc)}", exc_info=True)
+    return _internal_error_response("An unexpected error occurred")
+
+
+# The environment is fixed for the process lifetime, so pick the handler once
+app.add_exception_handler(
+    Exception,
+    development_exception_handler if settings.is_development else production_exception_handler
+)
+
+
+# The root payload never changes, so it is encoded once and the response reused
+_ROOT_RESPONSE = Response(
+    content=orjson.dumps({
         "service": "ElevenLabs Agent Connector",
         "version": "1.0.0",
         "status": "running"
-    }
+    }),
+    media_type="application/json"
+)
+
+
+@app.get("/")
+async def root():
+    return _ROOT_RESPONSE
 
 
 if __name__ == "__main__":
+    import sys
     import uvicorn
 
     uvicorn.run(
@@ -104,5 +140,7 @@ if __name__ == "__main__":
         host=settings.host,
         port=settings.port,
         reload=settings.is_development,
-        log_level=settings.log_level.lower()
+        log_level=settings.log_level.lower(),
+        # uvloop is a requirement on Linux/macOS; Windows has no uvloop build
+        loop="asyncio" if sys.platform == "win32" else "uvloop"
     )
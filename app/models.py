@@ -1,29 +1,68 @@
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field, field_validator
 from typing import Optional, Dict, Any
-from datetime import datetime
+from datetime import datetime, timezone
+from functools import partial
+
+# Shared timestamp factory; a partial avoids the extra Python frame of a lambda
+_utcnow = partial(datetime.now, timezone.utc)
+
+
+class InitiateCallMetadata(BaseModel):
+    # Extra keys are kept so callers can attach their own bookkeeping fields
+    model_config = ConfigDict(frozen=True, extra="allow")
+
+    to_number: Optional[str] = None
+    dynamic_variables: Dict[str, Any] = Field(default_factory=dict)
+
+    @field_validator("to_number", mode="before")
+    @classmethod
+    def _number_to_str(cls, value: Any) -> Any:
+        # Clients may send the number as JSON int; pydantic v2 does not coerce it
+        if isinstance(value, int) and not isinstance(value, bool):
+            return str(value)
+        return value
+
+    @field_validator("dynamic_variables", mode="before")
+    @classmethod
+    def _null_to_empty(cls, value: Any) -> Any:
+        return {} if value is None else value
 
 
 class InitiateCallRequest(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     agent_id: str
     session_id: Optional[str] = None
-    metadata: Optional[Dict[str, Any]] = Field(default_factory=dict)
+    metadata: Optional[InitiateCallMetadata] = Field(default_factory=InitiateCallMetadata)
+
+    @field_validator("metadata", mode="before")
+    @classmethod
+    def _null_metadata_to_empty(cls, value: Any) -> Any:
+        # "metadata": null has always been accepted as "no metadata"
+        return {} if value is None else value
 
 
 class InitiateCallResponse(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     success: bool
     session_id: str
     websocket_url: str
     message: str
-    timestamp: datetime = Field(default_factory=datetime.utcnow)
+    timestamp: datetime = Field(default_factory=_utcnow)
 
 
 class ErrorResponse(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     success: bool = False
     error: str
     detail: Optional[str] = None
-    timestamp: datetime = Field(default_factory=datetime.utcnow)
+    timestamp: datetime = Field(default_factory=_utcnow)
 
 
 class HealthResponse(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     status: str
-    timestamp: datetime = Field(default_factory=datetime.utcnow)
+    timestamp: datetime = Field(default_factory=_utcnow)
@@ -5,15 +5,19 @@ Provides dialer-agnostic endpoints that work with any registered dialer plugin.
 """
 
 import logging
-import json
 import asyncio
 import base64
+from functools import lru_cache, partial
+from types import MappingProxyType
+import orjson
 from fastapi import APIRouter, WebSocket, WebSocketDisconnect, Depends, HTTPException, status, Response, Form
 from fastapi.responses import PlainTextResponse
+from starlette.websockets import WebSocketState
 
 from app.models import InitiateCallRequest
 from app.auth import verify_api_key
 from app.config import settings
+from app.services.dialers.base import BOOL_MAP, relay_agent_audio
 from app.services.dialers.registry import DialerRegistry
 from app.services.dialers.context import store_call_context, get_call_context, cleanup_call_context
 from app.services.agents.registry import AgentRegistry
@@ -23,11 +27,48 @@ logger = logging.getLogger(__name__)
 
 router = APIRouter()
 
-
+# Caller audio frames coalesced into one agent message (two 20ms telephony
+# frames, i.e. 40ms). Counted in frames rather than bytes because the resampled
+# PCM size per frame depends on the dialer's converter (Twilio yields 638 bytes).
+AGENT_AUDIO_FRAMES_PER_CHUNK = 2
+
+# Caller audio messages queued for the agent; when the agent falls behind the
+# oldest message is dropped so the dialer socket is never blocked on it
+AGENT_SEND_QUEUE_SIZE = 4
+
+# Longest time cleanup waits for a socket to close before moving on
+CLOSE_TIMEOUT_SECONDS = 2.0
+
+# Stream parameters that configure the call rather than the agent's dynamic variables
+_RESERVED_STREAM_PARAMS = frozenset({"agent_id", "to_number"})
+
+# Hardcoded dynamic variables for incoming calls, for testing (replace with database
+# lookup in production). Read-only so every call can share the same mapping.
+_DEFAULT_DYNAMIC_VARIABLES = MappingProxyType({
+    "name": "Test Customer",
+    "due_date": "30th January 2026",
+    "total_enr_amount": "25000",
+    "emi_eligibility": True,
+    "waiver_eligible": False,
+    "emi_eligible": True
+})
+
+# Static fallback returned when an incoming call cannot be connected. It is served
+# with 200 so the dialer still plays the message instead of its own error prompt.
+_SERVICE_UNAVAILABLE_RESPONSE = Response(
+    content=b'<?xml version="1.0" encoding="UTF-8"?><Response><Say>Service temporarily unavailable</Say><Hangup/></Response>',
+    media_type="application/xml"
+)
+
+
+@lru_cache(maxsize=16)
 def build_websocket_url(dialer_name: str) -> str:
     """
     Build WebSocket URL for the specified dialer
 
+    The URL depends only on static settings, so it is memoized per dialer.
+    Call build_websocket_url.cache_clear() if settings are changed (e.g. in tests).
+
     Args:
         dialer_name: Name of the dialer
 
@@ -64,8 +105,7 @@ async def initiate_outbound_call(
     """
     try:
         # Get dialer service
-        dialer_class = DialerRegistry.get(dialer_name)
-        dialer = dialer_class()
+        dialer = DialerRegistry.get_instance(dialer_name)
 
         # Validate dialer configuration
         if not dialer.validate_config():
@@ -75,9 +115,8 @@ async def initiate_outbound_call(
             )
 
         # Extract data from request
-        metadata = request.metadata or {}
-        to_number = metadata.get("to_number")
-        dynamic_variables = metadata.get("dynamic_variables", {})
+        to_number = request.metadata.to_number
+        dynamic_variables = request.metadata.dynamic_variables
 
         if not to_number:
             raise HTTPException(
@@ -88,8 +127,8 @@ async def initiate_outbound_call(
         # Build WebSocket URL
         websocket_url = build_websocket_url(dialer_name)
 
-        logger.info(f"📡 WebSocket URL for {dialer_name}: {websocket_url}")
-        logger.info(f"📞 Initiating outbound call via {dialer_name} to {to_number}")
+        logger.info("📡 WebSocket URL for %s: %s", dialer_name, websocket_url)
+        logger.info("📞 Initiating outbound call via %s to %s", dialer_name, to_number)
 
         # Initiate call using dialer
         result = await dialer.initiate_outbound_call(
@@ -103,7 +142,7 @@ async def initiate_outbound_call(
 
     except ValueError as e:
         # Dialer not registered
-        logger.error(f"Dialer error: {e}")
+        logger.error("Dialer error: %s", e)
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=str(e)
@@ -113,7 +152,7 @@ async def initiate_outbound_call(
         raise
 
     except Exception as e:
-        logger.error(f"Error initiating outbound call: {e}", exc_info=True)
+        logger.error("Error initiating outbound call: %s", e, exc_info=True)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Failed to initiate outbound call: {str(e)}"
@@ -140,8 +179,7 @@ async def handle_incoming_call(
     """
     try:
         # Get dialer service
-        dialer_class = DialerRegistry.get(dialer_name)
-        dialer = dialer_class()
+        dialer = DialerRegistry.get_instance(dialer_name)
 
         # Use default agent ID if not provided
         if not agent_id:
@@ -150,19 +188,12 @@ async def handle_incoming_call(
         # Hardcoded context for testing (replace with database lookup in production)
         context = {
             "agent_id": agent_id,
-            "dynamic_variables": {
-                "name": "Test Customer",
-                "due_date": "30th January 2026",
-                "total_enr_amount": "25000",
-                "emi_eligibility": True,
-                "waiver_eligible": False,
-                "emi_eligible": True
-            }
+            "dynamic_variables": _DEFAULT_DYNAMIC_VARIABLES
         }
 
         # Generate a temporary call ID (will be replaced when WebSocket connects)
         # For now, we store with a placeholder
-        logger.info(f"📞 Incoming call via {dialer_name}, agent: {agent_id}")
+        logger.info("📞 Incoming call via %s, agent: %s", dialer_name, agent_id)
 
         # Build WebSocket URL
         websocket_url = build_websocket_url(dialer_name)
@@ -173,36 +204,22 @@ async def handle_incoming_call(
             custom_params=None
         )
 
-        logger.info(f"📄 Returning connection response for {dialer_name}")
+        logger.info("📄 Returning connection response for %s", dialer_name)
 
         # Return appropriate content type based on dialer
         return Response(content=response_content, media_type="application/xml")
 
     except ValueError as e:
-        logger.error(f"Dialer error: {e}")
+        logger.error("Dialer error: %s", e)
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=str(e)
         )
 
     except Exception as e:
-        logger.error(f"Error handling incoming call: {e}", exc_info=True)
+        logger.error("Error handling incoming call: %s", e, exc_info=True)
         # Return error response in dialer format
-        error_response = '<?xml version="1.0" encoding="UTF-8"?><Response><Say>Service temporarily unavailable</Say><Hangup/></Response>'
-        return Response(content=error_response, media_type="application/xml")
-
-    except ValueError as e:
-        logger.error(f"Dialer error: {e}")
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=str(e)
-        )
-
-    except Exception as e:
-        logger.error(f"Error handling incoming call: {e}", exc_info=True)
-        # Return error response in dialer format
-        error_response = '<?xml version="1.0" encoding="UTF-8"?><Response><Say>Service temporarily unavailable</Say><Hangup/></Response>'
-        return Response(content=error_response, media_type="application/xml")
+        return _SERVICE_UNAVAILABLE_RESPONSE
 
 
 @router.websocket("/{dialer_name}/media-stream")
@@ -215,22 +232,31 @@ async def media_stream(websocket: WebSocket, dialer_name: str):
         dialer_name: Name of the dialer (e.g., "twilio", "plivo")
     """
     await websocket.accept()
-    logger.info(f"🔌 {dialer_name.capitalize()} WebSocket connection established")
-    logger.info(f"📍 WebSocket client: {websocket.client}")
+    logger.info("🔌 %s WebSocket connection established", dialer_name.capitalize())
+    logger.debug("📍 WebSocket client: %s", websocket.client)
 
     call_id = None
     stream_id = None
     agent_stream = None
+    receive_task = None
+    send_task = None
+    send_queue = None
+    audio_buffer = bytearray()
+    buffered_frames = 0
 
     try:
         # Get dialer service
-        dialer_class = DialerRegistry.get(dialer_name)
-        dialer = dialer_class()
+        dialer = DialerRegistry.get_instance(dialer_name)
 
         while True:
-            # Receive message from dialer
-            message = await websocket.receive_text()
-            data = json.loads(message)
+            # Receive message from dialer. Frames are parsed as delivered (text or
+            # binary) since orjson accepts both, avoiding a forced str conversion.
+            message = await websocket.receive()
+            if message["type"] == "websocket.disconnect":
+                raise WebSocketDisconnect(message.get("code", 1000))
+
+            raw = message.get("text")
+            data = orjson.loads(raw if raw is not None else message["bytes"])
 
             # Parse using dialer's connection handler
             parsed = await dialer.connection_handler.handle_incoming_message(data)
@@ -241,8 +267,9 @@ async def media_stream(websocket: WebSocket, dialer_name: str):
                 call_id = parsed.get("call_id")
                 stream_id = parsed.get("stream_id")
 
-                logger.info(f"🎬 Media stream started - CallID: {call_id}, StreamID: {stream_id}")
-                logger.info(f"📦 Parsed start data: {parsed}")
+                logger.info("🎬 Media stream started - CallID: %s, StreamID: %s", call_id, stream_id)
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug("📦 Parsed start data: %s", parsed)
 
                 # Try to get stored context (for incoming calls)
                 context = get_call_context(call_id)
@@ -251,22 +278,19 @@ async def media_stream(websocket: WebSocket, dialer_name: str):
                 if not context:
                     custom_params = parsed.get("custom_parameters", {})
                     if custom_params:
-                        logger.info(f"Using custom parameters: {custom_params}")
+                        if logger.isEnabledFor(logging.DEBUG):
+                            logger.debug("Using custom parameters: %s", custom_params)
 
                         # Extract agent_id
                         agent_id = custom_params.get("agent_id", "agent_7201keyx3brmfk68gdwytc6a4tna")
 
-                        # Build dynamic variables from custom parameters
-                        dynamic_variables = {}
-                        for key, value in custom_params.items():
-                            if key not in ["agent_id", "to_number"]:
-                                # Convert string booleans back to actual booleans
-                                if value == "true":
-                                    dynamic_variables[key] = True
-                                elif value == "false":
-                                    dynamic_variables[key] = False
-                                else:
-                                    dynamic_variables[key] = value
+                        # Build dynamic variables from custom parameters,
+                        # converting string booleans back to actual booleans
+                        dynamic_variables = {
+                            key: BOOL_MAP.get(value, value) if isinstance(value, str) else value
+                            for key, value in custom_params.items()
+                            if key not in _RESERVED_STREAM_PARAMS
+                        }
 
                         context = {
                             "agent_id": agent_id,
@@ -274,7 +298,7 @@ async def media_stream(websocket: WebSocket, dialer_name: str):
                         }
 
                 if not context:
-                    logger.error(f"No context found for call {call_id}")
+                    logger.error("No context found for call %s", call_id)
                     await websocket.close()
                     return
 
@@ -286,121 +310,239 @@ async def media_stream(websocket: WebSocket, dialer_name: str):
                 # Get agent provider from settings or context
                 agent_provider = settings.default_agent
                 
-                logger.info(f"🤖 Connecting to {agent_provider} agent {agent_id}")
-                agent_service_class = AgentRegistry.get(agent_provider)
-                agent_service = agent_service_class()
+                logger.debug("🤖 Connecting to %s agent %s", agent_provider, agent_id)
+                agent_service = AgentRegistry.get_instance(agent_provider)
                 
                 # Connect and get stream
                 agent_stream = await agent_service.connect(agent_id, dynamic_variables)
-                logger.info(f"✅ Connected to Agent Stream")
+                logger.debug("✅ Connected to Agent Stream")
                 
                 # Initialize agent (send config)
                 await agent_stream.initialize()
-                logger.info("✅ Agent initialized")
+                logger.debug("✅ Agent initialized")
 
                 # Start background task to receive from Agent
-                asyncio.create_task(
+                receive_task = asyncio.create_task(
                     receive_from_agent(agent_stream, websocket, stream_id, dialer)
                 )
 
+                # Start background task to send caller audio to Agent
+                send_queue = asyncio.Queue(maxsize=AGENT_SEND_QUEUE_SIZE)
+                send_task = asyncio.create_task(send_to_agent(agent_stream, send_queue))
+
             elif event_type == "media":
                 # Audio from caller
                 audio_payload = parsed.get("audio_payload")
 
-                if audio_payload and agent_stream:
+                if audio_payload and send_task:
+                    if send_task.done():
+                        # Re-raise whatever stopped the agent sender
+                        send_task.result()
+                        break
+
                     # Convert dialer audio to PCM using dialer's converter
-                    pcm_audio = dialer.audio_converter.dialer_to_pcm(audio_payload)
+                    audio_buffer += dialer.audio_converter.dialer_to_pcm(audio_payload)
+                    buffered_frames += 1
 
-                    # Send PCM audio to Agent
-                    await agent_stream.send_audio(pcm_audio)
+                    # Queue PCM audio for the Agent once enough frames are buffered;
+                    # the filled buffer is handed over instead of copied
+                    if buffered_frames >= AGENT_AUDIO_FRAMES_PER_CHUNK:
+                        queue_agent_audio(send_queue, audio_buffer)
+                        audio_buffer = bytearray()
+                        buffered_frames = 0
 
             elif event_type == "stop":
                 # Call ended
-                logger.info(f"Media stream stopped for call {call_id}")
+                logger.info("Media stream stopped for call %s", call_id)
+
+                if send_task and not send_task.done():
+                    # Deliver the last partial batch before the sender is stopped
+                    if audio_buffer:
+                        queue_agent_audio(send_queue, audio_buffer)
+                        audio_buffer = bytearray()
+                    await finish_agent_sender(send_queue, send_task, call_id)
                 break
 
             elif event_type == "mark":
                 # Mark event (for synchronization)
                 mark_name = parsed.get("mark_name")
-                logger.debug(f"Received mark: {mark_name}")
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug("Received mark: %s", mark_name)
 
             elif event_type == "dtmf":
                 # DTMF event (key press)
                 digit = parsed.get("digit")
-                logger.info(f"Received DTMF digit: {digit}")
+                logger.info("Received DTMF digit: %s", digit)
                 # Optional: You could pass this to the agent if supported
                 # if agent_stream:
                 #     await agent_stream.send_dtmf(digit)
 
             else:
                 # Unknown event
-                logger.warning(f"Received unknown event from dialer: {parsed}")
+                logger.warning("Received unknown event from dialer: %s", parsed)
 
     except WebSocketDisconnect:
-        logger.info(f"{dialer_name.capitalize()} WebSocket disconnected for call {call_id}")
+        logger.info("%s WebSocket disconnected for call %s", dialer_name.capitalize(), call_id)
     except ValueError as e:
-        logger.error(f"Dialer error: {e}")
+        logger.error("Dialer error: %s", e)
     except Exception as e:
-        logger.error(f"Error in {dialer_name} media stream: {e}", exc_info=True)
+        logger.error("Error in %s media stream: %s", dialer_name, e, exc_info=True)
     finally:
-        # Cleanup
+        # Cleanup: stop the agent tasks before closing the sockets they use
+        for task in (send_task, receive_task):
+            if task and not task.done():
+                task.cancel()
+                await asyncio.gather(task, return_exceptions=True)
+
         if agent_stream:
             try:
-                await agent_stream.close()
-            except:
-                pass
+                await asyncio.wait_for(agent_stream.close(), timeout=CLOSE_TIMEOUT_SECONDS)
+            except Exception as e:
+                logger.warning("Agent stream close failed for call %s: %r", call_id, e)
 
         if call_id:
             cleanup_call_context(call_id)
 
-        try:
-            await websocket.close()
-        except:
-            pass
+        # Skip sockets already closed by either side (e.g. after a disconnect)
+        if (websocket.client_state != WebSocketState.DISCONNECTED
+                and websocket.application_state != WebSocketState.DISCONNECTED):
+            try:
+                await asyncio.wait_for(websocket.close(), timeout=CLOSE_TIMEOUT_SECONDS)
+            except Exception as e:
+                logger.warning("%s WebSocket close failed for call %s: %r", dialer_name.capitalize(), call_id, e)
+
+        logger.info("Cleaned up resources for call %s", call_id)
+
+
+def queue_agent_audio(send_queue, pcm_audio) -> None:
+    """
+    Queue a batch of caller PCM for send_to_agent without blocking
+
+    When the queue is full the agent is behind; real-time audio favours the
+    newest frames, so the oldest queued batch is dropped.
+    """
+    if send_queue.full():
+        send_queue.get_nowait()
+        logger.debug("Agent send queue full, dropped oldest audio")
+    send_queue.put_nowait(pcm_audio)
+
+
+async def send_to_agent(agent_stream, send_queue):
+    """
+    Background task to send queued caller audio to the Agent
+
+    Decouples the dialer receive loop from the agent connection, so a slow
+    agent never stalls reads from the dialer socket. Returns once it takes
+    None (end of stream) off the queue.
+
+    Args:
+        agent_stream: AgentStream instance
+        send_queue: Queue of PCM audio messages
+    """
+    while True:
+        pcm_audio = await send_queue.get()
+        if pcm_audio is None:
+            return
+        await agent_stream.send_audio(pcm_audio)
+
+
+async def finish_agent_sender(send_queue, send_task, call_id) -> None:
+    """
+    Let send_to_agent send everything already queued, then end it
+
+    Bounded by CLOSE_TIMEOUT_SECONDS so a stalled agent cannot hold up cleanup.
+    """
+    try:
+        await asyncio.wait_for(send_queue.put(None), timeout=CLOSE_TIMEOUT_SECONDS)
+        await asyncio.wait_for(send_task, timeout=CLOSE_TIMEOUT_SECONDS)
+    except Exception as e:
+        logger.warning("Agent audio not fully sent for call %s: %r", call_id, e)
+
+
+async def _send_audio_to_dialer(dialer_ws, dialer, encode_frame, pcm_bytes) -> None:
+    """
+    Convert agent PCM to the dialer's format and send it as one media message
+
+    pcm_bytes may be the caller's reusable buffer; it is fully converted
+    before the first await, so the caller can clear it once this returns.
+    """
+    if encode_frame is None:
+        # Binary-capable dialer: raw audio, no base64 or JSON envelope
+        await dialer_ws.send_bytes(dialer.audio_converter.pcm_to_dialer_bytes(pcm_bytes))
+        return
+
+    # Convert PCM to dialer format using dialer's converter
+    dialer_audio = dialer.audio_converter.pcm_to_dialer(pcm_bytes)
+
+    # Send to dialer. Media stream protocols such as Twilio's only
+    # accept JSON in text frames, so this stays send_text, not send_bytes.
+    await dialer_ws.send_text(encode_frame(dialer_audio))
+
+
+def _on_agent_text(event, pending_audio) -> None:
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("Agent response: %s", event.data)
+
+
+def _on_agent_transcription(event, pending_audio) -> None:
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("Transcription (%s): %s", event.metadata.get('source', 'unknown'), event.data)
+
+
+def _on_agent_interruption(event, pending_audio) -> None:
+    # Audio still buffered belongs to the interrupted response
+    pending_audio.clear()
+    logger.debug("User interrupted agent")
 
-        logger.info(f"Cleaned up resources for call {call_id}")
+
+def _on_agent_error(event, pending_audio) -> None:
+    logger.error("Agent error: %s", event.data)
+
+
+# Non-audio agent event type → handler(event, pending_audio); other types are ignored
+_AGENT_EVENT_HANDLERS = {
+    AgentEventTypes.TEXT: _on_agent_text,
+    AgentEventTypes.TRANSCRIPTION: _on_agent_transcription,
+    AgentEventTypes.INTERRUPTION: _on_agent_interruption,
+    AgentEventTypes.ERROR: _on_agent_error,
+}
+
+
+async def _handle_agent_event(event, pending_audio):
+    """relay_agent_audio handler: returns audio event PCM, dispatches the rest"""
+    # Audio is the bulk of the traffic, so it is checked first
+    if event.type == AgentEventTypes.AUDIO:
+        return event.data
+
+    # Everything else (text, transcription, interruption, errors)
+    handler = _AGENT_EVENT_HANDLERS.get(event.type)
+    if handler:
+        handler(event, pending_audio)
+    return None
 
 
 async def receive_from_agent(agent_stream, dialer_ws, stream_id, dialer):
     """
     Background task to receive audio from Agent and send to dialer
 
+    Agent audio is batched by relay_agent_audio() before it is converted.
+
     Args:
         agent_stream: AgentStream instance
         dialer_ws: Dialer WebSocket connection
         stream_id: Stream identifier
         dialer: Dialer service instance
     """
-    try:
-        async for event in agent_stream.receive():
-            
-            # Handle audio event
-            if event.type == AgentEventTypes.AUDIO:
-                pcm_bytes = event.data
-                
-                # Convert PCM to dialer format using dialer's converter
-                dialer_audio = dialer.audio_converter.pcm_to_dialer(pcm_bytes)
-
-                # Build dialer message
-                dialer_message = dialer.message_builder.build_audio_message(
-                    stream_id, dialer_audio
-                )
-
-                # Send to dialer
-                await dialer_ws.send_text(json.dumps(dialer_message))
-
-            # Handle text/transcription events
-            elif event.type == AgentEventTypes.TEXT:
-                logger.info(f"Agent response: {event.data}")
-            
-            elif event.type == AgentEventTypes.TRANSCRIPTION:
-                logger.info(f"Transcription ({event.metadata.get('source', 'unknown')}): {event.data}")
-                
-            elif event.type == AgentEventTypes.INTERRUPTION:
-                logger.info("User interrupted agent")
-                
-            elif event.type == AgentEventTypes.ERROR:
-                logger.error(f"Agent error: {event.data}")
+    encode_frame = (
+        None if dialer.supports_binary_media
+        else dialer.message_builder.build_audio_frame_encoder(stream_id)
+    )
 
+    try:
+        await relay_agent_audio(
+            agent_stream.receive(),
+            _handle_agent_event,
+            partial(_send_audio_to_dialer, dialer_ws, dialer, encode_frame)
+        )
     except Exception as e:
-        logger.error(f"Error receiving from Agent: {e}", exc_info=True)
+        logger.error("Error receiving from Agent: %s", e, exc_info=True)
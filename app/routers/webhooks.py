@@ -1,11 +1,13 @@
 import logging
 import uuid
-import json
 import asyncio
-import base64
-from fastapi import APIRouter, Depends, HTTPException, status, BackgroundTasks, Form, WebSocket, WebSocketDisconnect, Response
+import binascii
+from functools import lru_cache, partial
+from xml.sax.saxutils import quoteattr
+import orjson
+from fastapi import APIRouter, Depends, HTTPException, status, Form, WebSocket, WebSocketDisconnect, Response
 from app.services.agents.elevenlabs import elevenlabs_service
-from twilio.rest import Client
+from starlette.websockets import WebSocketState
 
 """
 DEPRECATED: This router is deprecated in favor of the generic `app/routers/dialer.py`.
@@ -23,18 +25,60 @@ from app.auth import verify_api_key
 from app.services import audio_service
 from app.services.twilio_service import (
     TwilioAudioConverter,
-    TwilioMessageBuilder,
-    generate_twiml_response,
-    store_call_context,
-    get_call_context,
-    cleanup_call_context
+    TwilioMessageBuilder
 )
 from app.config import settings
+from app.services.dialers.base import BOOL_MAP, BOOL_STR, relay_agent_audio
+from app.services.dialers.twilio.service import _get_twilio_client
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter()
 
+# Running conversation streams started by initiate_call. The event loop only keeps
+# weak references to tasks, so they are held here until they finish.
+_conversation_tasks = set()
+
+# TwiML connecting a call to the media stream: the stream URL and its <Parameter> elements
+_STREAM_TWIML = (
+    '<?xml version="1.0" encoding="UTF-8"?>'
+    '<Response><Connect><Stream url=%s>%s</Stream></Connect></Response>'
+)
+# Attribute values are substituted already quoted and escaped by quoteattr()
+_TWIML_PARAMETER = '<Parameter name=%s value=%s />'
+
+# Longest time cleanup waits for a socket to close before moving on
+_CLOSE_TIMEOUT_SECONDS = 2.0
+
+# Reply to ElevenLabs ping events; constant, so it is serialized once
+_PONG_FRAME = orjson.dumps({"type": "pong_event"}).decode()
+
+# ElevenLabs user audio frame: {"user_audio_chunk": "<base64 PCM>"}
+_USER_AUDIO_PREFIX = b'{"user_audio_chunk":"'
+_USER_AUDIO_SUFFIX = b'"}'
+
+
+@lru_cache(maxsize=1)
+def _twilio_websocket_url() -> str:
+    """WebSocket URL for the deprecated Twilio media stream (settings are static)"""
+    protocol = "wss" if settings.environment == "production" else "ws"
+    host = settings.host if settings.host != "0.0.0.0" else "localhost"
+    return f"{protocol}://{host}:{settings.port}/twilio/media-stream"
+
+
+def _stream_twiml(websocket_url: str, parameters) -> str:
+    """
+    Build TwiML that connects the call to the media stream
+
+    The (name, value) pairs in parameters reach the media stream as the
+    start event's customParameters, so no per-call state is kept here.
+    """
+    parameters_xml = "".join(
+        _TWIML_PARAMETER % (quoteattr(key), quoteattr(BOOL_STR[value] if isinstance(value, bool) else str(value)))
+        for key, value in parameters
+    )
+    return _STREAM_TWIML % (quoteattr(websocket_url), parameters_xml)
+
 
 @router.get("/health", response_model=HealthResponse)
 async def health_check():
@@ -51,18 +95,17 @@ async def health_check():
 )
 async def initiate_call(
     request: InitiateCallRequest,
-    background_tasks: BackgroundTasks,
     api_key: str = Depends(verify_api_key)
 ):
     session_id = request.session_id or str(uuid.uuid4())
 
     logger.info(
-        f"Initiating call - Session: {session_id}, Agent: {request.agent_id}, "
-        f"Metadata: {request.metadata}"
+        "Initiating call - Session: %s, Agent: %s, Metadata: %s",
+        session_id, request.agent_id, request.metadata
     )
 
     try:
-        logger.info(f"Requesting signed URL for agent {request.agent_id}")
+        logger.info("Requesting signed URL for agent %s", request.agent_id)
         signed_url = await elevenlabs_service.get_signed_url(request.agent_id)
 
         logger.info("Establishing WebSocket connection")
@@ -72,18 +115,21 @@ async def initiate_call(
 
         async def run_audio_stream():
             try:
-                dynamic_variables = request.metadata.get("dynamic_variables") if request.metadata else None
+                dynamic_variables = request.metadata.dynamic_variables or None
                 await audio_service.start_conversation_stream(
                     websocket,
                     duration=None,
                     dynamic_variables=dynamic_variables
                 )
             except Exception as e:
-                logger.error(f"Error in background audio stream: {str(e)}")
+                logger.error("Error in background audio stream: %s", e)
 
-        background_tasks.add_task(run_audio_stream)
+        # Run detached from the request; the stream lasts as long as the conversation
+        task = asyncio.create_task(run_audio_stream())
+        _conversation_tasks.add(task)
+        task.add_done_callback(_conversation_tasks.discard)
 
-        logger.info(f"Call initiated successfully - Session: {session_id}")
+        logger.info("Call initiated successfully - Session: %s", session_id)
 
         return InitiateCallResponse(
             success=True,
@@ -93,14 +139,14 @@ async def initiate_call(
         )
 
     except elevenlabs_service.ElevenLabsError as e:
-        logger.error(f"ElevenLabs error: {str(e)}")
+        logger.error("ElevenLabs error: %s", e)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Failed to connect to ElevenLabs: {str(e)}"
         )
 
     except Exception as e:
-        logger.error(f"Unexpected error initiating call: {str(e)}", exc_info=True)
+        logger.error("Unexpected error initiating call: %s", e, exc_info=True)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Failed to initiate call: {str(e)}"
@@ -133,9 +179,8 @@ async def initiate_outbound_call(
     logger.warning("⚠️ DEPRECATED: /twilio/outbound-call endpoint is deprecated. Use /{dialer_name}/outbound-call instead")
     try:
         # Extract customer data from request
-        metadata = request.metadata or {}
-        dynamic_variables = metadata.get("dynamic_variables", {})
-        to_number = metadata.get("to_number")
+        dynamic_variables = request.metadata.dynamic_variables
+        to_number = request.metadata.to_number
 
         if not to_number:
             raise HTTPException(
@@ -150,48 +195,32 @@ async def initiate_outbound_call(
                 detail="Twilio credentials not configured"
             )
 
-        # Initialize Twilio client
-        twilio_client = Client(settings.twilio_account_sid, settings.twilio_auth_token)
+        twilio_client = _get_twilio_client()
 
         # Determine WebSocket URL
-        protocol = "wss" if settings.environment == "production" else "ws"
-        host = settings.host if settings.host != "0.0.0.0" else "localhost"
-        websocket_url = f"{protocol}://{host}:{settings.port}/twilio/media-stream"
-
-        logger.info(f"📡 WebSocket URL for Twilio: {websocket_url}")
-        logger.info(f"🔧 Environment: {settings.environment}, Host: {settings.host}, Port: {settings.port}")
-
-        # Build TwiML with customer data as Stream parameters
-        parameters_xml = ""
-        for key, value in dynamic_variables.items():
-            # Convert boolean to string
-            if isinstance(value, bool):
-                value = "true" if value else "false"
-            parameters_xml += f'<Parameter name="{key}" value="{value}" />\n            '
-
-        # Add agent_id as parameter
-        parameters_xml += f'<Parameter name="agent_id" value="{request.agent_id}" />\n            '
-        parameters_xml += f'<Parameter name="to_number" value="{to_number}" />'
-
-        twiml = f'''<?xml version="1.0" encoding="UTF-8"?>
-<Response>
-    <Connect>
-        <Stream url="{websocket_url}">
-            {parameters_xml}
-        </Stream>
-    </Connect>
-</Response>'''
+        websocket_url = _twilio_websocket_url()
 
-        logger.info(f"📄 Generated TwiML:\n{twiml}")
+        logger.info("📡 WebSocket URL for Twilio: %s", websocket_url)
+        logger.info("🔧 Environment: %s, Host: %s, Port: %s", settings.environment, settings.host, settings.port)
 
-        # Make outbound call
-        call = twilio_client.calls.create(
+        # Build TwiML with customer data (plus agent_id and to_number) as Stream parameters
+        twiml = _stream_twiml(
+            websocket_url,
+            (*dynamic_variables.items(), ("agent_id", request.agent_id), ("to_number", to_number))
+        )
+
+        logger.info("📄 Generated TwiML:\n%s", twiml)
+
+        # Make outbound call. The Twilio SDK is blocking, so run it in a
+        # worker thread to keep the event loop serving media streams.
+        call = await asyncio.to_thread(
+            twilio_client.calls.create,
             from_=settings.twilio_phone_number,
             to=to_number,
             twiml=twiml
         )
 
-        logger.info(f"✅ Outbound call initiated - CallSid: {call.sid}, To: {to_number}")
+        logger.info("✅ Outbound call initiated - CallSid: %s, To: %s", call.sid, to_number)
 
         return {
             "success": True,
@@ -204,7 +233,7 @@ async def initiate_outbound_call(
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Error initiating outbound call: {e}", exc_info=True)
+        logger.error("Error initiating outbound call: %s", e, exc_info=True)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Failed to initiate outbound call: {str(e)}"
@@ -235,40 +264,32 @@ async def twilio_incoming_call(
         TwiML XML instructing Twilio to start media streaming
     """
     logger.warning("⚠️ DEPRECATED: /twilio/incoming-call endpoint is deprecated. Use /{dialer_name}/incoming-call instead")
-    logger.info(f"Incoming Twilio call - From: {From}, To: {To}, CallSid: {CallSid}")
+    logger.info("Incoming Twilio call - From: %s, To: %s, CallSid: %s", From, To, CallSid)
 
     try:
         # Hardcoded customer context (replace with database lookup in production)
-        customer_context = {
+        agent_id = "agent_7201keyx3brmfk68gdwytc6a4tna"
+        dynamic_variables = {
+            "name": "Sumit Sharma",
             "caller_number": From,
-            "agent_id": "agent_7201keyx3brmfk68gdwytc6a4tna",
-            "dynamic_variables": {
-                "name": "Sumit Sharma",
-                "caller_number": From,
-                "due_date": "30th January 2026",
-                "total_enr_amount": "25000",
-                "emi_eligibility": True,
-                "waiver_eligible": False,
-                "emi_eligible": True
-            }
+            "due_date": "30th January 2026",
+            "total_enr_amount": "25000",
+            "emi_eligibility": True,
+            "waiver_eligible": False,
+            "emi_eligible": True
         }
 
-        # Store context for when WebSocket connects
-        store_call_context(CallSid, customer_context)
-
         # Determine WebSocket URL (use your public domain in production)
-        protocol = "wss" if settings.environment == "production" else "ws"
-        host = settings.host if settings.host != "0.0.0.0" else "localhost"
-        websocket_url = f"{protocol}://{host}:{settings.port}/twilio/media-stream"
+        websocket_url = _twilio_websocket_url()
 
-        # Generate TwiML response
-        twiml = generate_twiml_response(websocket_url)
+        # Generate TwiML response; the context travels to the media stream as Stream parameters
+        twiml = _stream_twiml(websocket_url, (*dynamic_variables.items(), ("agent_id", agent_id)))
 
-        logger.info(f"Responding with TwiML for call {CallSid}")
+        logger.info("Responding with TwiML for call %s", CallSid)
         return Response(content=twiml, media_type="application/xml")
 
     except Exception as e:
-        logger.error(f"Error handling Twilio incoming call: {e}", exc_info=True)
+        logger.error("Error handling Twilio incoming call: %s", e, exc_info=True)
         # Return error TwiML
         error_twiml = '''<?xml version="1.0" encoding="UTF-8"?>
 <Response>
@@ -294,19 +315,25 @@ async def twilio_media_stream(websocket: WebSocket):
     await websocket.accept()
     logger.warning("⚠️ DEPRECATED: /twilio/media-stream WebSocket is deprecated. Use /{dialer_name}/media-stream instead")
     logger.info("🔌 Twilio WebSocket connection established")
-    logger.info(f"📍 WebSocket client: {websocket.client}")
+    logger.info("📍 WebSocket client: %s", websocket.client)
 
     call_sid = None
     stream_sid = None
     elevenlabs_ws = None
+    recv_task = None
     audio_converter = TwilioAudioConverter()
     msg_builder = TwilioMessageBuilder()
 
     try:
         while True:
-            # Receive message from Twilio
-            message = await websocket.receive_text()
-            data = json.loads(message)
+            # Receive message from Twilio. Frames are parsed as delivered (text or
+            # binary) since orjson accepts both, avoiding a forced str conversion.
+            message = await websocket.receive()
+            if message["type"] == "websocket.disconnect":
+                raise WebSocketDisconnect(message.get("code", 1000))
+
+            raw = message.get("text")
+            data = orjson.loads(raw if raw is not None else message["bytes"])
 
             event_type = data.get("event")
 
@@ -316,67 +343,46 @@ async def twilio_media_stream(websocket: WebSocket):
                 call_sid = start_data.get("callSid")
                 stream_sid = start_data.get("streamSid")
 
-                # Extract custom parameters from Stream (for outbound calls)
+                # Call context arrives as Stream parameters set in the TwiML
                 custom_parameters = start_data.get("customParameters", {})
 
-                logger.info(f"🎬 Media stream started - CallSid: {call_sid}, StreamSid: {stream_sid}")
-                logger.info(f"📦 Start data received: {start_data}")
-
-                # Try to get stored context (for inbound calls)
-                context = get_call_context(call_sid)
-
-                # If no stored context, check custom parameters (for outbound calls)
-                if not context and custom_parameters:
-                    logger.info(f"Using custom parameters from outbound call: {custom_parameters}")
-
-                    # Extract agent_id from parameters
-                    agent_id = custom_parameters.get("agent_id", "agent_7201keyx3brmfk68gdwytc6a4tna")
-
-                    # Build dynamic variables from custom parameters
-                    dynamic_variables = {}
-                    for key, value in custom_parameters.items():
-                        if key != "agent_id":
-                            # Convert string booleans back to actual booleans
-                            if value == "true":
-                                dynamic_variables[key] = True
-                            elif value == "false":
-                                dynamic_variables[key] = False
-                            else:
-                                dynamic_variables[key] = value
-
-                    context = {
-                        "agent_id": agent_id,
-                        "dynamic_variables": dynamic_variables
-                    }
-
-                if not context:
-                    logger.error(f"No context found for call {call_sid}")
+                logger.info("🎬 Media stream started - CallSid: %s, StreamSid: %s", call_sid, stream_sid)
+                logger.info("📦 Start data received: %s", start_data)
+
+                if not custom_parameters:
+                    logger.error("No context found for call %s", call_sid)
                     await websocket.close()
                     return
 
-                # Get agent ID and dynamic variables
-                agent_id = context.get("agent_id")
-                dynamic_variables = context.get("dynamic_variables")
+                logger.info("Using custom parameters: %s", custom_parameters)
 
-                # Connect to ElevenLabs
-                logger.info(f"🤖 Connecting to ElevenLabs agent {agent_id}")
-                signed_url = await elevenlabs_service.get_signed_url(agent_id)
-                logger.info(f"🔗 ElevenLabs WebSocket URL: {signed_url}")
+                # Extract agent_id from parameters
+                agent_id = custom_parameters.get("agent_id", "agent_7201keyx3brmfk68gdwytc6a4tna")
 
-                elevenlabs_ws = await elevenlabs_service.create_websocket_connection(signed_url)
-                logger.info(f"✅ Connected to ElevenLabs WebSocket")
+                # Build dynamic variables from custom parameters,
+                # converting string booleans back to actual booleans
+                dynamic_variables = {
+                    key: BOOL_MAP.get(value, value) if isinstance(value, str) else value
+                    for key, value in custom_parameters.items()
+                    if key != "agent_id"
+                }
+
+                # Connect to ElevenLabs
+                logger.info("🤖 Connecting to ElevenLabs agent %s", agent_id)
+                elevenlabs_ws = await elevenlabs_service.connect_agent(agent_id)
+                logger.info("✅ Connected to ElevenLabs WebSocket")
 
                 # Send initialization message to ElevenLabs
                 init_message = {
                     "type": "conversation_initiation_client_data",
                     "dynamic_variables": dynamic_variables or {}
                 }
-                logger.info(f"📤 Sending initialization with dynamic variables: {dynamic_variables}")
-                await elevenlabs_ws.send(json.dumps(init_message))
+                logger.info("📤 Sending initialization with dynamic variables: %s", dynamic_variables)
+                await elevenlabs_ws.send(orjson.dumps(init_message).decode())
                 logger.info("✅ Sent initialization to ElevenLabs")
 
                 # Start background task to receive from ElevenLabs
-                asyncio.create_task(
+                recv_task = asyncio.create_task(
                     receive_from_elevenlabs(elevenlabs_ws, websocket, stream_sid, audio_converter, msg_builder)
                 )
 
@@ -389,52 +395,123 @@ async def twilio_media_stream(websocket: WebSocket):
                     # Convert mu-law 8kHz → PCM 16kHz
                     pcm_audio = audio_converter.mulaw_to_pcm(mulaw_payload)
 
-                    # Encode to base64 for ElevenLabs
-                    pcm_base64 = base64.b64encode(pcm_audio).decode('utf-8')
+                    # Encode to base64 for ElevenLabs; base64 is plain ASCII, so the
+                    # JSON frame is assembled directly without an encoder pass
+                    pcm_base64 = binascii.b2a_base64(pcm_audio, newline=False)
 
                     # Send to ElevenLabs
-                    elevenlabs_message = {
-                        "user_audio_chunk": pcm_base64
-                    }
-                    await elevenlabs_ws.send(json.dumps(elevenlabs_message))
+                    elevenlabs_message = _USER_AUDIO_PREFIX + pcm_base64 + _USER_AUDIO_SUFFIX
+                    await elevenlabs_ws.send(elevenlabs_message.decode("ascii"))
 
             elif event_type == "stop":
                 # Call ended
-                logger.info(f"Media stream stopped for call {call_sid}")
+                logger.info("Media stream stopped for call %s", call_sid)
                 break
 
             elif event_type == "mark":
                 # Mark event (for synchronization)
-                mark_data = data.get("mark", {})
-                logger.debug(f"Received mark: {mark_data.get('name')}")
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug("Received mark: %s", data.get("mark", {}).get('name'))
 
     except WebSocketDisconnect:
-        logger.info(f"Twilio WebSocket disconnected for call {call_sid}")
+        logger.info("Twilio WebSocket disconnected for call %s", call_sid)
     except Exception as e:
-        logger.error(f"Error in Twilio media stream: {e}", exc_info=True)
+        logger.error("Error in Twilio media stream: %s", e, exc_info=True)
     finally:
         # Cleanup
+        if recv_task:
+            recv_task.cancel()
+            await asyncio.gather(recv_task, return_exceptions=True)
+
         if elevenlabs_ws:
             try:
-                await elevenlabs_ws.close()
-            except:
-                pass
+                await asyncio.wait_for(elevenlabs_ws.close(), timeout=_CLOSE_TIMEOUT_SECONDS)
+            except Exception as e:
+                logger.warning("ElevenLabs WebSocket close failed for call %s: %r", call_sid, e)
+
+        # Skip sockets already closed by either side (e.g. after a disconnect)
+        if (websocket.client_state != WebSocketState.DISCONNECTED
+                and websocket.application_state != WebSocketState.DISCONNECTED):
+            try:
+                await asyncio.wait_for(websocket.close(), timeout=_CLOSE_TIMEOUT_SECONDS)
+            except Exception as e:
+                logger.warning("Twilio WebSocket close failed for call %s: %r", call_sid, e)
 
-        if call_sid:
-            cleanup_call_context(call_sid)
+        logger.info("Cleaned up resources for call %s", call_sid)
 
-        try:
-            await websocket.close()
-        except:
-            pass
 
-        logger.info(f"Cleaned up resources for call {call_sid}")
+async def _send_audio_to_twilio(twilio_ws, audio_converter, encode_media, pcm_bytes) -> None:
+    """Convert agent PCM 16kHz to mu-law 8kHz and send it as one Twilio media message"""
+    mulaw_payload = audio_converter.pcm_to_mulaw(pcm_bytes)
+    await twilio_ws.send_text(encode_media(mulaw_payload))
+
+
+async def _on_audio(data, elevenlabs_ws, pending_audio):
+    """Return agent audio for Twilio; relay_agent_audio sends it in batches"""
+    audio_event = data.get("audio_event")
+    if not audio_event:
+        return None
+
+    pcm_base64 = audio_event.get("audio_base_64")
+    if pcm_base64:
+        # binascii is the C routine behind base64.b64decode
+        return binascii.a2b_base64(pcm_base64)
+    return None
+
+
+async def _on_interruption(data, elevenlabs_ws, pending_audio):
+    # Audio still buffered belongs to the interrupted response
+    pending_audio.clear()
+    logger.info("User interrupted agent")
+
+
+async def _on_agent_response(data, elevenlabs_ws, pending_audio):
+    if logger.isEnabledFor(logging.INFO):
+        logger.info("Agent response: %s", data.get('agent_response_event', {}).get('response'))
+
+
+async def _on_user_transcription(data, elevenlabs_ws, pending_audio):
+    if logger.isEnabledFor(logging.INFO):
+        logger.info("User said: %s", data.get('user_transcription_event', {}).get('user_transcription'))
+
+
+async def _on_ping(data, elevenlabs_ws, pending_audio):
+    # Respond to ping
+    await elevenlabs_ws.send(_PONG_FRAME)
+
+
+# ElevenLabs event type → handler; unknown types are ignored. Handlers return
+# the PCM an event carries, or None.
+_ELEVENLABS_HANDLERS = {
+    "audio": _on_audio,
+    "interruption_event": _on_interruption,
+    "agent_response_event": _on_agent_response,
+    "user_transcription_event": _on_user_transcription,
+    "ping_event": _on_ping,
+}
+
+
+async def _handle_elevenlabs_message(elevenlabs_ws, message, pending_audio):
+    """relay_agent_audio handler: parses one ElevenLabs frame and dispatches it"""
+    # Events are JSON in text or binary frames; orjson parses both as-is
+    try:
+        data = orjson.loads(message)
+    except orjson.JSONDecodeError:
+        logger.warning("Ignoring non-JSON frame from ElevenLabs (%d bytes)", len(message))
+        return None
+
+    handler = _ELEVENLABS_HANDLERS.get(data.get("type"))
+    if handler:
+        return await handler(data, elevenlabs_ws, pending_audio)
+    return None
 
 
 async def receive_from_elevenlabs(elevenlabs_ws, twilio_ws, stream_sid, audio_converter, msg_builder):
     """
     Background task to receive audio from ElevenLabs and send to Twilio
 
+    Agent audio is batched by relay_agent_audio() before it is converted.
+
     Args:
         elevenlabs_ws: ElevenLabs WebSocket connection
         twilio_ws: Twilio WebSocket connection
@@ -442,43 +519,14 @@ async def receive_from_elevenlabs(elevenlabs_ws, twilio_ws, stream_sid, audio_co
         audio_converter: Audio converter instance
         msg_builder: Twilio message builder instance
     """
-    try:
-        while True:
-            message = await elevenlabs_ws.recv()
-
-            if isinstance(message, str):
-                data = json.loads(message)
-
-                # Handle audio from agent
-                if data.get("type") == "audio" and "audio_event" in data:
-                    audio_event = data["audio_event"]
-                    pcm_base64 = audio_event.get("audio_base_64")
-
-                    if pcm_base64:
-                        # Decode PCM audio
-                        pcm_bytes = base64.b64decode(pcm_base64)
-
-                        # Convert PCM 16kHz → mu-law 8kHz
-                        mulaw_payload = audio_converter.pcm_to_mulaw(pcm_bytes)
-
-                        # Send to Twilio
-                        twilio_message = msg_builder.build_media_message(stream_sid, mulaw_payload)
-                        await twilio_ws.send_text(json.dumps(twilio_message))
-
-                # Handle other ElevenLabs events
-                elif data.get("type") == "interruption_event":
-                    logger.info("User interrupted agent")
-
-                elif data.get("type") == "agent_response_event":
-                    logger.info(f"Agent response: {data.get('agent_response_event', {}).get('response')}")
-
-                elif data.get("type") == "user_transcription_event":
-                    logger.info(f"User said: {data.get('user_transcription_event', {}).get('user_transcription')}")
-
-                elif data.get("type") == "ping_event":
-                    # Respond to ping
-                    pong = {"type": "pong_event"}
-                    await elevenlabs_ws.send(json.dumps(pong))
+    encode_media = msg_builder.build_media_frame_encoder(stream_sid)
 
+    try:
+        # Iterating the connection ends quietly when ElevenLabs closes it normally
+        await relay_agent_audio(
+            elevenlabs_ws,
+            partial(_handle_elevenlabs_message, elevenlabs_ws),
+            partial(_send_audio_to_twilio, twilio_ws, audio_converter, encode_media)
+        )
     except Exception as e:
-        logger.error(f"Error receiving from ElevenLabs: {e}", exc_info=True)
\ No newline at end of file
+        logger.error("Error receiving from ElevenLabs: %s", e, exc_info=True)
@@ -2,8 +2,10 @@
 Abstract Base Classes for Agent Plugins
 """
 
+import importlib.util
 from abc import ABC, abstractmethod
 from typing import AsyncGenerator, Dict, Any, Optional
+import httpx
 from app.services.agents.types import AgentEvent
 
 
@@ -11,6 +13,19 @@ from app.services.agents.types import AgentEvent
 # All agent plugins must handle conversion to/from this format internally.
 AGENT_AUDIO_FORMAT = "PCM 16kHz mono 16-bit signed little-endian"
 
+# Keep-alive pool for an agent's REST API, shared by every connect() so repeated
+# requests reuse warm TCP/TLS connections instead of handshaking each time.
+# HTTP/2 is negotiated over TLS, letting concurrent calls share one connection
+HTTP_LIMITS = httpx.Limits(
+    max_keepalive_connections=20,
+    max_connections=100,
+    keepalive_expiry=30.0
+)
+
+# httpx needs the optional h2 package (httpx[http2]) for HTTP/2; deployments
+# installed without it fall back to HTTP/1.1 instead of failing every connect()
+HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
 
 class AgentMessageHandler(ABC):
     """Handles agent-specific message formatting"""
@@ -77,7 +92,8 @@ class AgentStream(ABC):
         Send PCM 16kHz audio chunk to the agent.
         
         Args:
-            audio_data: PCM 16kHz mono 16-bit signed little-endian bytes
+            audio_data: PCM 16kHz mono 16-bit signed little-endian audio, as
+                bytes or bytearray (the router hands over its buffer uncopied)
         """
         pass
 
@@ -97,8 +113,25 @@ class AgentStream(ABC):
 class AgentService(ABC):
     """
     Factory class for creating agent connections.
+
+    One instance per provider is shared across calls (see AgentRegistry.get_instance);
+    per-call state belongs on the AgentStream returned by connect().
     """
 
+    # Pooled HTTP client, created by _get_http_client() on first use so it binds
+    # to the running event loop
+    _http_client: Optional[httpx.AsyncClient] = None
+
+    def _get_http_client(self) -> httpx.AsyncClient:
+        """Return this service's shared HTTP client, creating it on first use."""
+        if self._http_client is None or self._http_client.is_closed:
+            self._http_client = httpx.AsyncClient(
+                http2=HTTP2_AVAILABLE,
+                timeout=10.0,
+                limits=HTTP_LIMITS
+            )
+        return self._http_client
+
     @abstractmethod
     def get_message_handler(self) -> AgentMessageHandler:
         """Return the message handler instance for this agent"""
@@ -131,3 +164,12 @@ class AgentService(ABC):
     def validate_config(self) -> bool:
         """Check if API keys and required settings are valid"""
         pass
+
+    async def aclose(self) -> None:
+        """
+        Release resources shared across connections (e.g. the pooled HTTP client).
+        Called once on application shutdown.
+        """
+        if self._http_client is not None:
+            await self._http_client.aclose()
+            self._http_client = None
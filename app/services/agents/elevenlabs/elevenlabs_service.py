@@ -3,6 +3,7 @@ import websockets
 import logging
 from typing import Optional
 from app.config import settings
+from app.services.agents.registry import AgentRegistry
 
 logger = logging.getLogger(__name__)
 
@@ -36,7 +37,7 @@ async def get_signed_url(agent_id: str) -> str:
             if not signed_url:
                 raise ElevenLabsError("No signed URL in response")
 
-            logger.info(f"Successfully obtained signed URL for agent {agent_id}")
+            logger.info("Successfully obtained signed URL for agent %s", agent_id)
             return signed_url
 
     except httpx.HTTPStatusError as e:
@@ -71,3 +72,18 @@ async def create_websocket_connection(signed_url: str):
         error_msg = f"Failed to establish WebSocket connection: {str(e)}"
         logger.error(error_msg)
         raise ElevenLabsError(error_msg) from e
+
+
+async def connect_agent(agent_id: str):
+    """
+    Open an agent WebSocket, reusing a recently issued signed URL
+
+    Delegates to the registered ElevenLabs agent service so both routers share
+    one signed URL cache (see ElevenLabsAgentService.open_websocket).
+    """
+    try:
+        return await AgentRegistry.get_instance("elevenlabs").open_websocket(agent_id)
+    except Exception as e:
+        error_msg = f"Failed to connect to ElevenLabs agent: {str(e)}"
+        logger.error(error_msg)
+        raise ElevenLabsError(error_msg) from e
@@ -2,37 +2,62 @@
 ElevenLabs Message Handler
 """
 
-import json
-import base64
+import binascii
 import logging
-from typing import Any, Dict
+import orjson
+from typing import Any, Dict, Optional, Tuple
 from app.services.agents.base import AgentMessageHandler
 from app.services.agents.types import AgentEvent, AgentEventTypes
 
 logger = logging.getLogger(__name__)
 
+# Most chunk lengths that get a pre-encoded silence message. Lengths depend on
+# the dialer's converter (two Twilio frames resample to 1276 bytes, not 1280),
+# so entries are added per length on first use rather than fixed up front.
+SILENCE_CACHE_MAX_SIZES = 8
+
+# User audio message: {"user_audio_chunk": "<base64 PCM>"}
+_USER_AUDIO_PREFIX = b'{"user_audio_chunk":"'
+_USER_AUDIO_SUFFIX = b'"}'
+
 
 class ElevenLabsMessageHandler(AgentMessageHandler):
     """Handles ElevenLabs-specific message formatting"""
 
+    def __init__(self):
+        # Pre-encoded messages for all-zero chunks (silent callers and VAD gaps
+        # are common), keyed by chunk length: (silence bytes, message)
+        self._silence_cache: Dict[int, Tuple[bytes, str]] = {}
+
     def build_audio_message(self, audio_data: bytes) -> str:
         """
         Build ElevenLabs audio message.
         Expected format: JSON with "user_audio_chunk" containing base64 audio.
         """
-        # Encode PCM bytes to base64
-        audio_base64 = base64.b64encode(audio_data).decode('utf-8')
-        
-        return json.dumps({
-            "user_audio_chunk": audio_base64
-        })
+        size = len(audio_data)
+        cached = self._silence_cache.get(size)
+        if cached is None and len(self._silence_cache) < SILENCE_CACHE_MAX_SIZES:
+            silence = bytes(size)
+            cached = self._silence_cache[size] = (silence, self._encode_audio_message(silence))
+
+        if cached is not None and audio_data == cached[0]:
+            return cached[1]
+
+        return self._encode_audio_message(audio_data)
+
+    @staticmethod
+    def _encode_audio_message(audio_data: bytes) -> str:
+        # Fixed single-key shape, so splice the base64 between a pre-built
+        # prefix/suffix instead of serializing a dict; all ASCII, decoded once
+        audio_base64 = binascii.b2a_base64(audio_data, newline=False)
+        return (_USER_AUDIO_PREFIX + audio_base64 + _USER_AUDIO_SUFFIX).decode('ascii')
 
     def build_initialization_message(self, dynamic_variables: Dict[str, Any]) -> str:
         """
         Build ElevenLabs initialization message.
         Expected format: JSON with "conversation_initiation_client_data".
         """
-        return json.dumps({
+        return orjson.dumps({
             "type": "conversation_initiation_client_data",
             "conversation_config_override": {
                 "agent": {
@@ -44,62 +69,22 @@ class ElevenLabsMessageHandler(AgentMessageHandler):
                 }
             } if dynamic_variables.get("prompt") or dynamic_variables.get("first_message") else None,
             "dynamic_variables": dynamic_variables
-        })
+        }).decode()
 
     def parse_message(self, message: Any) -> AgentEvent:
         """
         Parse incoming ElevenLabs message to standardized AgentEvent.
+        Accepts text or binary frames; orjson parses both without a decode.
         """
-        if not isinstance(message, str):
-            logger.warning(f"Received non-string message from ElevenLabs: {type(message)}")
-            return AgentEvent(type=AgentEventTypes.ERROR, data="Invalid message format")
-
         try:
-            data = json.loads(message)
+            data = orjson.loads(message)
             msg_type = data.get("type")
 
-            # 1. Audio Event
-            if msg_type == "audio":
-                audio_event = data.get("audio_event", {})
-                audio_base64 = audio_event.get("audio_base_64")
-                
-                if audio_base64:
-                    audio_bytes = base64.b64decode(audio_base64)
-                    return AgentEvent(type=AgentEventTypes.AUDIO, data=audio_bytes)
-                
-            # 2. Agent Response (Text)
-            elif msg_type == "agent_response_event":
-                response = data.get("agent_response_event", {}).get("response", "")
-                return AgentEvent(type=AgentEventTypes.TEXT, data=response)
-
-            # 3. User Transcription
-            elif msg_type == "user_transcription_event":
-                transcription = data.get("user_transcription_event", {}).get("user_transcription", "")
-                return AgentEvent(
-                    type=AgentEventTypes.TRANSCRIPTION, 
-                    data=transcription,
-                    metadata={"source": "user"}
-                )
-
-            # 4. Interruption
-            elif msg_type == "interruption_event":
-                return AgentEvent(type=AgentEventTypes.INTERRUPTION, data=True)
-
-            # 5. Ping/Pong
-            elif msg_type == "ping":
-                return AgentEvent(
-                    type=AgentEventTypes.PONG, 
-                    data=data.get("event_id"),
-                    metadata={"ping_event": data}
-                )
-
-            # 6. Error (Custom handling if needed, though ElevenLabs sends errors differently sometimes)
-            elif msg_type == "error":
-                return AgentEvent(
-                    type=AgentEventTypes.ERROR, 
-                    data=data.get("message", "Unknown error"),
-                    error=Exception(data.get("message"))
-                )
+            parser = self._PARSERS.get(msg_type)
+            if parser:
+                event = parser(self, data)
+                if event is not None:
+                    return event
 
             # Default / Ignored events
             return AgentEvent(
@@ -108,16 +93,71 @@ class ElevenLabsMessageHandler(AgentMessageHandler):
                 metadata={"original_type": msg_type}
             )
 
-        except json.JSONDecodeError:
+        except orjson.JSONDecodeError:
             return AgentEvent(
                 type=AgentEventTypes.ERROR, 
                 data="Failed to decode JSON",
                 error=Exception("JSON decode error")
             )
         except Exception as e:
-            logger.error(f"Error parsing ElevenLabs message: {e}")
+            logger.error("Error parsing ElevenLabs message: %s", e)
             return AgentEvent(
                 type=AgentEventTypes.ERROR, 
                 data=str(e),
                 error=e
             )
+
+    # 1. Audio Event
+    def _parse_audio(self, data: Dict) -> Optional[AgentEvent]:
+        audio_event = data.get("audio_event", {})
+        audio_base64 = audio_event.get("audio_base_64")
+
+        if audio_base64:
+            audio_bytes = binascii.a2b_base64(audio_base64)
+            return AgentEvent(type=AgentEventTypes.AUDIO, data=audio_bytes)
+        return None
+
+    # 2. Agent Response (Text)
+    def _parse_agent_response(self, data: Dict) -> AgentEvent:
+        response = data.get("agent_response_event", {}).get("response", "")
+        return AgentEvent(type=AgentEventTypes.TEXT, data=response)
+
+    # 3. User Transcription
+    def _parse_user_transcription(self, data: Dict) -> AgentEvent:
+        transcription = data.get("user_transcription_event", {}).get("user_transcription", "")
+        return AgentEvent(
+            type=AgentEventTypes.TRANSCRIPTION, 
+            data=transcription,
+            metadata={"source": "user"}
+        )
+
+    # 4. Interruption
+    def _parse_interruption(self, data: Dict) -> AgentEvent:
+        return AgentEvent(type=AgentEventTypes.INTERRUPTION, data=True)
+
+    # 5. Ping/Pong
+    def _parse_ping(self, data: Dict) -> AgentEvent:
+        return AgentEvent(
+            type=AgentEventTypes.PONG, 
+            data=data.get("event_id"),
+            metadata={"ping_event": data}
+        )
+
+    # 6. Error (Custom handling if needed, though ElevenLabs sends errors differently sometimes)
+    def _parse_error(self, data: Dict) -> AgentEvent:
+        return AgentEvent(
+            type=AgentEventTypes.ERROR, 
+            data=data.get("message", "Unknown error"),
+            error=Exception(data.get("message"))
+        )
+
+    # Parsers by ElevenLabs message type; a parser returning None (or an
+    # unlisted type) falls back to a METADATA event
+    _PARSERS = {
+        "audio": _parse_audio,
+        "agent_response_event": _parse_agent_response,
+        "user_transcription_event": _parse_user_transcription,
+        "interruption_event": _parse_interruption,
+        "ping": _parse_ping,
+        "error": _parse_error,
+    }
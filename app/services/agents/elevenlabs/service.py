@@ -2,10 +2,13 @@
 ElevenLabs Agent Service
 """
 
+import asyncio
 import logging
+import time
 import httpx
 import websockets
-from typing import Dict, Any, Optional
+from websockets.client import WebSocketClientProtocol
+from typing import Dict, Any, Optional, Tuple
 
 from app.config import settings
 from app.services.agents.base import AgentService, AgentStream, AgentMessageHandler
@@ -16,6 +19,10 @@ logger = logging.getLogger(__name__)
 
 ELEVENLABS_API_BASE = "https://api.elevenlabs.io/v1"
 
+# Signed URLs are valid for 15 minutes; a cached one is reused for this long
+# after it was issued (reuse does not extend it), well inside that window
+SIGNED_URL_TTL_SECONDS = 45
+
 
 class ElevenLabsAgentService(AgentService):
     """
@@ -24,6 +31,11 @@ class ElevenLabsAgentService(AgentService):
     
     def __init__(self):
         self._message_handler = ElevenLabsMessageHandler()
+        # agent_id -> (expires_at, signed_url), for URLs that have connected successfully;
+        # expires_at is set when the URL is first cached and not extended on reuse
+        self._signed_urls: Dict[str, Tuple[float, str]] = {}
+        # agent_id -> in-flight signed URL request, shared by concurrent connects
+        self._signed_url_requests: Dict[str, "asyncio.Task[str]"] = {}
 
     def get_message_handler(self) -> AgentMessageHandler:
         return self._message_handler
@@ -47,23 +59,64 @@ class ElevenLabsAgentService(AgentService):
         params = {"agent_id": agent_id}
 
         try:
-            async with httpx.AsyncClient() as client:
-                response = await client.get(url, headers=headers, params=params, timeout=10.0)
-                response.raise_for_status()
+            response = await self._get_http_client().get(url, headers=headers, params=params)
+            response.raise_for_status()
 
-                data = response.json()
-                signed_url = data.get("signed_url")
+            data = response.json()
+            signed_url = data.get("signed_url")
 
-                if not signed_url:
-                    raise ValueError("No signed URL in response from ElevenLabs")
+            if not signed_url:
+                raise ValueError("No signed URL in response from ElevenLabs")
 
-                return signed_url
+            return signed_url
 
         except httpx.HTTPStatusError as e:
             raise ValueError(f"ElevenLabs API error: {e.response.status_code} - {e.response.text}") from e
         except Exception as e:
             raise ValueError(f"Failed to get signed URL: {str(e)}") from e
 
+    def _request_signed_url(self, agent_id: str) -> "asyncio.Task[str]":
+        """
+        Return the in-flight signed URL request for agent_id, starting one if needed.
+        A burst of connects for the same agent then makes a single API call.
+        """
+        task = self._signed_url_requests.get(agent_id)
+        if task is None:
+            task = asyncio.create_task(self._get_signed_url(agent_id))
+            self._signed_url_requests[agent_id] = task
+            task.add_done_callback(lambda _: self._signed_url_requests.pop(agent_id, None))
+        return task
+
+    async def open_websocket(self, agent_id: str) -> WebSocketClientProtocol:
+        """
+        Open an agent WebSocket, reusing a recently issued signed URL
+
+        A cached URL is reused until it expires. If ElevenLabs rejects it, it is
+        dropped and a new URL is requested once; concurrent requests for the same
+        agent share a single API call.
+        """
+        cached = self._signed_urls.get(agent_id)
+        if cached and cached[0] > time.monotonic():
+            try:
+                return await websockets.connect(cached[1])
+            except Exception as e:
+                logger.info("Cached signed URL rejected for agent %s (%s), requesting a new one", agent_id, e)
+                self._signed_urls.pop(agent_id, None)
+
+        # Join any concurrent request for this agent; shielded so a cancelled
+        # caller does not cancel it for the others
+        signed_url = await asyncio.shield(self._request_signed_url(agent_id))
+        logger.debug("Got signed URL: %s...", signed_url[:30])
+
+        websocket = await websockets.connect(signed_url)
+
+        # Callers that shared the request keep the first expiry for this URL
+        cached = self._signed_urls.get(agent_id)
+        if cached is None or cached[1] != signed_url:
+            self._signed_urls[agent_id] = (time.monotonic() + SIGNED_URL_TTL_SECONDS, signed_url)
+
+        return websocket
+
     async def connect(
         self, 
         agent_id: str, 
@@ -71,22 +124,18 @@ class ElevenLabsAgentService(AgentService):
     ) -> AgentStream:
         """
         Connect to ElevenLabs agent.
-        1. Get signed URL
+        1. Get signed URL (cached for SIGNED_URL_TTL_SECONDS)
         2. Open WebSocket
         3. Return initialized stream
         """
         if not self.validate_config():
             raise ValueError("ElevenLabs configuration invalid")
 
-        logger.info(f"Connecting to ElevenLabs agent {agent_id}...")
+        logger.info("Connecting to ElevenLabs agent %s...", agent_id)
         
         try:
-            # 1. Get signed URL
-            signed_url = await self._get_signed_url(agent_id)
-            logger.debug(f"Got signed URL: {signed_url[:30]}...")
-
-            # 2. Connect
-            websocket = await websockets.connect(signed_url)
+            # 1-2. Get signed URL (cached) and open WebSocket
+            websocket = await self.open_websocket(agent_id)
             logger.info("ElevenLabs WebSocket connected")
 
             # 3. Create Stream
@@ -99,5 +148,5 @@ class ElevenLabsAgentService(AgentService):
             return stream
 
         except Exception as e:
-            logger.error(f"Failed to connect to ElevenLabs: {e}")
+            logger.error("Failed to connect to ElevenLabs: %s", e)
             raise
@@ -3,8 +3,8 @@ ElevenLabs Agent Stream
 """
 
 import logging
-import json
 import asyncio
+import orjson
 from typing import AsyncGenerator, Dict, Any
 from websockets.client import WebSocketClientProtocol
 from websockets.exceptions import ConnectionClosed
@@ -15,6 +15,9 @@ from app.services.agents.elevenlabs.message_handler import ElevenLabsMessageHand
 
 logger = logging.getLogger(__name__)
 
+# Pong reply for the usual integer ping event_id; other ids go through orjson
+_PONG_TEMPLATE = '{"type":"pong","event_id":%d}'
+
 
 class ElevenLabsAgentStream(AgentStream):
     """
@@ -52,7 +55,7 @@ class ElevenLabsAgentStream(AgentStream):
         except ConnectionClosed:
             logger.warning("ElevenLabs WebSocket closed while sending audio")
         except Exception as e:
-            logger.error(f"Error sending audio to ElevenLabs: {e}")
+            logger.error("Error sending audio to ElevenLabs: %s", e)
             raise
 
     async def receive(self) -> AsyncGenerator[AgentEvent, None]:
@@ -73,12 +76,15 @@ class ElevenLabsAgentStream(AgentStream):
                     # Client responds: {"type": "pong", "event_id": ...}
                     
                     event_id = event.data
-                    pong_response = json.dumps({
-                        "type": "pong",
-                        "event_id": event_id
-                    })
+                    if type(event_id) is int:
+                        pong_response = _PONG_TEMPLATE % event_id
+                    else:
+                        pong_response = orjson.dumps({
+                            "type": "pong",
+                            "event_id": event_id
+                        }).decode()
                     await self.ws.send(pong_response)
-                    logger.debug(f"Responded to ping (event_id: {event_id})")
+                    logger.debug("Responded to ping (event_id: %s)", event_id)
                     continue
 
                 yield event
@@ -86,7 +92,7 @@ class ElevenLabsAgentStream(AgentStream):
         except ConnectionClosed:
             logger.info("ElevenLabs WebSocket connection closed")
         except Exception as e:
-            logger.error(f"Error receiving from ElevenLabs: {e}")
+            logger.error("Error receiving from ElevenLabs: %s", e)
             yield AgentEvent(type=AgentEventTypes.ERROR, data=str(e), error=e)
 
     async def close(self) -> None:
@@ -2,30 +2,40 @@
 PredixionAI Voice Message Handler
 """
 
-import json
-import base64
+import binascii
 import logging
-from typing import Any, Dict
+import orjson
+from typing import Any, Dict, Optional
 from app.services.agents.base import AgentMessageHandler
 from app.services.agents.types import AgentEvent, AgentEventTypes
 
 logger = logging.getLogger(__name__)
 
+# Audio message: {"type": "audio", "audio": "<base64 PCM>"}
+_AUDIO_PREFIX = b'{"type":"audio","audio":"'
+_AUDIO_SUFFIX = b'"}'
+
 
 class PredixionAIMessageHandler(AgentMessageHandler):
     """Handles PredixionAI Voice-specific message formatting"""
 
+    def __init__(self, binary_audio: bool = False):
+        # When enabled, PCM is sent as-is in binary WebSocket frames instead
+        # of base64 inside a JSON text frame
+        self.binary_audio = binary_audio
+
     def build_audio_message(self, audio_data: bytes) -> Any:
         """
         Build PredixionAI audio message.
         """
-        # Encode PCM bytes to base64
-        audio_base64 = base64.b64encode(audio_data).decode('utf-8')
+        if self.binary_audio:
+            # websockets sends bytes-like messages as binary frames
+            return audio_data
 
-        return json.dumps({
-            "type": "audio",
-            "audio": audio_base64
-        })
+        # Fixed shape, so splice the base64 between a pre-built prefix/suffix
+        # instead of serializing a dict; all ASCII, decoded once
+        audio_base64 = binascii.b2a_base64(audio_data, newline=False)
+        return (_AUDIO_PREFIX + audio_base64 + _AUDIO_SUFFIX).decode('ascii')
 
     def build_initialization_message(self, dynamic_variables: Dict[str, Any]) -> Any:
         """
@@ -45,60 +55,21 @@ class PredixionAIMessageHandler(AgentMessageHandler):
 
         # Handle string/JSON messages
         if not isinstance(message, str):
-            logger.warning(f"Received unexpected message type: {type(message)}")
+            logger.warning("Received unexpected message type: %s", type(message))
             return AgentEvent(
                 type=AgentEventTypes.ERROR,
                 data=f"Unexpected message type: {type(message)}"
             )
 
         try:
-            data = json.loads(message)
+            data = orjson.loads(message)
             msg_type = data.get("type", "").lower()
 
-            # Audio Event
-            if msg_type == "audio":
-                audio_data = data.get("audio") or data.get("audio_data")
-                if audio_data:
-                    if isinstance(audio_data, str):
-                        # Base64 encoded
-                        audio_bytes = base64.b64decode(audio_data)
-                    else:
-                        audio_bytes = audio_data
-                    return AgentEvent(type=AgentEventTypes.AUDIO, data=audio_bytes)
-
-            # Text/Response Event
-            elif msg_type in ["text", "response", "agent_response"]:
-                text = data.get("text") or data.get("response") or data.get("message")
-                return AgentEvent(type=AgentEventTypes.TEXT, data=text)
-
-            # Transcription Event
-            elif msg_type in ["transcription", "user_transcription"]:
-                transcription = data.get("transcription") or data.get("text")
-                return AgentEvent(
-                    type=AgentEventTypes.TRANSCRIPTION,
-                    data=transcription,
-                    metadata={"source": "user"}
-                )
-
-            # Interruption Event
-            elif msg_type == "interruption":
-                return AgentEvent(type=AgentEventTypes.INTERRUPTION, data=True)
-
-            # Ping/Pong (keep-alive)
-            elif msg_type == "ping":
-                return AgentEvent(
-                    type=AgentEventTypes.PONG,
-                    data=data.get("id") or data.get("event_id"),
-                    metadata={"ping_event": data}
-                )
-
-            # Error Event
-            elif msg_type == "error":
-                return AgentEvent(
-                    type=AgentEventTypes.ERROR,
-                    data=data.get("message") or data.get("error") or "Unknown error",
-                    error=Exception(data.get("message", "Unknown error"))
-                )
+            parser = self._PARSERS.get(msg_type)
+            if parser:
+                event = parser(self, data)
+                if event is not None:
+                    return event
 
             # Default: treat as metadata
             return AgentEvent(
@@ -107,7 +78,7 @@ class PredixionAIMessageHandler(AgentMessageHandler):
                 metadata={"original_type": msg_type}
             )
 
-        except json.JSONDecodeError:
+        except orjson.JSONDecodeError:
             # May be raw audio or binary data if not valid JSON
             return AgentEvent(
                 type=AgentEventTypes.ERROR,
@@ -115,9 +86,69 @@ class PredixionAIMessageHandler(AgentMessageHandler):
                 error=Exception("JSON decode error")
             )
         except Exception as e:
-            logger.error(f"Error parsing PredixionAI message: {e}")
+            logger.error("Error parsing PredixionAI message: %s", e)
             return AgentEvent(
                 type=AgentEventTypes.ERROR,
                 data=str(e),
                 error=e
             )
+
+    # Audio Event
+    def _parse_audio(self, data: Dict) -> Optional[AgentEvent]:
+        audio_data = data.get("audio") or data.get("audio_data")
+        if audio_data:
+            if isinstance(audio_data, str):
+                # Base64 encoded
+                audio_bytes = binascii.a2b_base64(audio_data)
+            else:
+                audio_bytes = audio_data
+            return AgentEvent(type=AgentEventTypes.AUDIO, data=audio_bytes)
+        return None
+
+    # Text/Response Event
+    def _parse_text(self, data: Dict) -> AgentEvent:
+        text = data.get("text") or data.get("response") or data.get("message")
+        return AgentEvent(type=AgentEventTypes.TEXT, data=text)
+
+    # Transcription Event
+    def _parse_transcription(self, data: Dict) -> AgentEvent:
+        transcription = data.get("transcription") or data.get("text")
+        return AgentEvent(
+            type=AgentEventTypes.TRANSCRIPTION,
+            data=transcription,
+            metadata={"source": "user"}
+        )
+
+    # Interruption Event
+    def _parse_interruption(self, data: Dict) -> AgentEvent:
+        return AgentEvent(type=AgentEventTypes.INTERRUPTION, data=True)
+
+    # Ping/Pong (keep-alive)
+    def _parse_ping(self, data: Dict) -> AgentEvent:
+        return AgentEvent(
+            type=AgentEventTypes.PONG,
+            data=data.get("id") or data.get("event_id"),
+            metadata={"ping_event": data}
+        )
+
+    # Error Event
+    def _parse_error(self, data: Dict) -> AgentEvent:
+        return AgentEvent(
+            type=AgentEventTypes.ERROR,
+            data=data.get("message") or data.get("error") or "Unknown error",
+            error=Exception(data.get("message", "Unknown error"))
+        )
+
+    # Parsers by lowercased message type; a parser returning None (or an
+    # unlisted type) falls back to a METADATA event
+    _PARSERS = {
+        "audio": _parse_audio,
+        "text": _parse_text,
+        "response": _parse_text,
+        "agent_response": _parse_text,
+        "transcription": _parse_transcription,
+        "user_transcription": _parse_transcription,
+        "interruption": _parse_interruption,
+        "ping": _parse_ping,
+        "error": _parse_error,
+    }
@@ -21,7 +21,9 @@ class PredixionAIAgentService(AgentService):
     """
 
     def __init__(self):
-        self._message_handler = PredixionAIMessageHandler()
+        self._message_handler = PredixionAIMessageHandler(
+            binary_audio=settings.predixionai_binary_audio
+        )
 
     def get_message_handler(self) -> AgentMessageHandler:
         return self._message_handler
@@ -67,23 +69,21 @@ class PredixionAIAgentService(AgentService):
             headers["Authorization"] = f"Bearer {settings.predixionai_api_key}"
 
         try:
-            async with httpx.AsyncClient() as client:
-                response = await client.post(
-                    url,
-                    json=payload,
-                    headers=headers,
-                    timeout=10.0
-                )
-                response.raise_for_status()
+            response = await self._get_http_client().post(
+                url,
+                json=payload,
+                headers=headers
+            )
+            response.raise_for_status()
 
-                data = response.json()
+            data = response.json()
 
-                websocket_url = data.get("websocket_url")
-                if not websocket_url:
-                    raise ValueError("No websocket_url in response from PredixionAI")
+            websocket_url = data.get("websocket_url")
+            if not websocket_url:
+                raise ValueError("No websocket_url in response from PredixionAI")
 
-                logger.info(f"PredixionAI session created: call_id={data.get('call_id')}")
-                return data
+            logger.info("PredixionAI session created: call_id=%s", data.get('call_id'))
+            return data
 
         except httpx.HTTPStatusError as e:
             raise ValueError(
@@ -103,7 +103,7 @@ class PredixionAIAgentService(AgentService):
         if not self.validate_config():
             raise ValueError("PredixionAI configuration invalid")
 
-        logger.info(f"Connecting to PredixionAI Voice agent (agent_id: {agent_id})...")
+        logger.info("Connecting to PredixionAI Voice agent (agent_id: %s)...", agent_id)
 
         try:
             # 1. Create session via HTTP POST
@@ -112,11 +112,11 @@ class PredixionAIAgentService(AgentService):
             websocket_url = session_data["websocket_url"]
             call_id = session_data["call_id"]
 
-            logger.debug(f"Got WebSocket URL: {websocket_url}")
+            logger.debug("Got WebSocket URL: %s", websocket_url)
 
             # 2. Connect to WebSocket
             websocket = await websockets.connect(websocket_url)
-            logger.info(f"PredixionAI WebSocket connected (call_id: {call_id})")
+            logger.info("PredixionAI WebSocket connected (call_id: %s)", call_id)
 
             # 3. Create Stream
             stream = PredixionAIAgentStream(
@@ -129,5 +129,5 @@ class PredixionAIAgentService(AgentService):
             return stream
 
         except Exception as e:
-            logger.error(f"Failed to connect to PredixionAI: {e}")
+            logger.error("Failed to connect to PredixionAI: %s", e)
             raise
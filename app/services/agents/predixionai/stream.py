@@ -3,7 +3,7 @@ PredixionAI Voice Agent Stream
 """
 
 import logging
-import json
+import orjson
 import asyncio
 from typing import AsyncGenerator, Dict, Any
 from websockets.client import WebSocketClientProtocol
@@ -39,7 +39,7 @@ class PredixionAIAgentStream(AgentStream):
         """
         Initialize the PredixionAI session.
         """
-        logger.info(f"Initializing PredixionAI session (call_id: {self.call_id})...")
+        logger.info("Initializing PredixionAI session (call_id: %s)...", self.call_id)
 
         init_msg = self.message_handler.build_initialization_message(self.dynamic_variables)
 
@@ -59,7 +59,7 @@ class PredixionAIAgentStream(AgentStream):
         except ConnectionClosed:
             logger.warning("PredixionAI WebSocket closed while sending audio")
         except Exception as e:
-            logger.error(f"Error sending audio to PredixionAI: {e}")
+            logger.error("Error sending audio to PredixionAI: %s", e)
             raise
 
     async def receive(self) -> AsyncGenerator[AgentEvent, None]:
@@ -74,12 +74,12 @@ class PredixionAIAgentStream(AgentStream):
                 if self.auto_ping_pong and event.type == AgentEventTypes.PONG:
                     # Respond to ping with pong
                     event_id = event.data
-                    pong_response = json.dumps({
+                    pong_response = orjson.dumps({
                         "type": "pong",
                         "id": event_id
-                    })
+                    }).decode()
                     await self.ws.send(pong_response)
-                    logger.debug(f"Responded to ping (id: {event_id})")
+                    logger.debug("Responded to ping (id: %s)", event_id)
                     continue
 
                 yield event
@@ -87,11 +87,11 @@ class PredixionAIAgentStream(AgentStream):
         except ConnectionClosed:
             logger.info("PredixionAI WebSocket connection closed")
         except Exception as e:
-            logger.error(f"Error receiving from PredixionAI: {e}")
+            logger.error("Error receiving from PredixionAI: %s", e)
             yield AgentEvent(type=AgentEventTypes.ERROR, data=str(e), error=e)
 
     async def close(self) -> None:
         """Close the WebSocket connection."""
         if self.ws:
             await self.ws.close()
-            logger.info(f"PredixionAI connection closed (call_id: {self.call_id})")
+            logger.info("PredixionAI connection closed (call_id: %s)", self.call_id)
@@ -13,6 +13,7 @@ class AgentRegistry:
     """Registry for Voice Agent plugins"""
 
     _agents: Dict[str, Type[AgentService]] = {}
+    _instances: Dict[str, AgentService] = {}
 
     @classmethod
     def register(cls, name: str, service_class: Type[AgentService]) -> None:
@@ -26,7 +27,7 @@ class AgentRegistry:
         name_lower = name.lower()
 
         if name_lower in cls._agents:
-            logger.warning(f"Agent '{name}' already registered, overwriting")
+            logger.warning("Agent '%s' already registered, overwriting", name)
 
         if not issubclass(service_class, AgentService):
             raise ValueError(
@@ -34,7 +35,8 @@ class AgentRegistry:
             )
 
         cls._agents[name_lower] = service_class
-        logger.info(f"Registered agent plugin: {name}")
+        cls._instances.pop(name_lower, None)
+        logger.info("Registered agent plugin: %s", name)
 
     @classmethod
     def get(cls, name: str) -> Type[AgentService]:
@@ -60,6 +62,41 @@ class AgentRegistry:
 
         return cls._agents[name_lower]
 
+    @classmethod
+    def get_instance(cls, name: str) -> AgentService:
+        """
+        Get the shared agent service instance by name.
+
+        Agent services are connection factories without per-call state,
+        so one instance per provider is created on first use and reused.
+
+        Args:
+            name: Agent name (case-insensitive)
+
+        Returns:
+            AgentService instance
+
+        Raises:
+            ValueError: If agent not found
+        """
+        name_lower = name.lower()
+
+        instance = cls._instances.get(name_lower)
+        if instance is None:
+            instance = cls.get(name_lower)()
+            cls._instances[name_lower] = instance
+
+        return instance
+
+    @classmethod
+    async def aclose_all(cls) -> None:
+        """Close all shared agent service instances (on application shutdown)"""
+        for name, instance in list(cls._instances.items()):
+            try:
+                await instance.aclose()
+            except Exception as e:
+                logger.error("Error closing agent plugin %s: %s", name, e)
+
     @classmethod
     def list_agents(cls) -> List[str]:
         """List all registered agent names"""
@@ -76,10 +113,12 @@ class AgentRegistry:
         name_lower = name.lower()
         if name_lower in cls._agents:
             del cls._agents[name_lower]
-            logger.info(f"Unregistered agent plugin: {name}")
+            cls._instances.pop(name_lower, None)
+            logger.info("Unregistered agent plugin: %s", name)
 
     @classmethod
     def clear(cls) -> None:
         """Clear all registered agents (for testing)"""
         cls._agents.clear()
+        cls._instances.clear()
         logger.info("Cleared all registered agent plugins")
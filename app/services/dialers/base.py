@@ -6,7 +6,22 @@ to integrate with the gateway.
 """
 
 from abc import ABC, abstractmethod
-from typing import Dict, Any, Optional
+from typing import AsyncIterable, Awaitable, Callable, Dict, Any, Optional
+import asyncio
+import binascii
+import orjson
+
+# Agent audio smaller than this is coalesced before it is sent to the dialer
+# (40ms of PCM 16kHz mono 16-bit)
+DIALER_AUDIO_CHUNK_BYTES = 1280
+
+# Longest time a partial batch of agent audio is held back waiting for more
+DIALER_AUDIO_FLUSH_SECONDS = 0.02
+
+# Stream parameters are strings, so booleans are sent as "true"/"false":
+# BOOL_STR encodes them into the TwiML, BOOL_MAP decodes them on the media stream
+BOOL_STR = {True: "true", False: "false"}
+BOOL_MAP = {"true": True, "false": False}
 
 
 class AudioConverter(ABC):
@@ -36,13 +51,30 @@ class AudioConverter(ABC):
         Convert PCM 16kHz from ElevenLabs to dialer format
 
         Args:
-            pcm_data: PCM 16kHz audio bytes from ElevenLabs
+            pcm_data: PCM 16kHz audio from ElevenLabs (bytes, or a bytearray
+                the caller reuses once this returns)
 
         Returns:
             Base64-encoded audio in dialer format
         """
         pass
 
+    def pcm_to_dialer_bytes(self, pcm_data: bytes) -> bytes:
+        """
+        Convert PCM 16kHz from ElevenLabs to raw dialer audio bytes
+
+        Used instead of pcm_to_dialer() for dialers that accept binary media
+        frames. The default decodes pcm_to_dialer(); converters should
+        override it to skip the base64 round trip.
+
+        Args:
+            pcm_data: PCM 16kHz audio bytes from ElevenLabs
+
+        Returns:
+            Raw audio bytes in dialer format
+        """
+        return binascii.a2b_base64(self.pcm_to_dialer(pcm_data))
+
 
 class MessageBuilder(ABC):
     """
@@ -65,6 +97,25 @@ class MessageBuilder(ABC):
         """
         pass
 
+    def build_audio_frame_encoder(self, stream_id: str) -> Callable[[str], str]:
+        """
+        Build a per-stream encoder that turns an audio payload into a wire frame
+
+        Called once per media stream. The default serializes
+        build_audio_message() for every frame; builders whose envelope is
+        fixed per stream can override this to precompute it.
+
+        Args:
+            stream_id: Unique stream identifier
+
+        Returns:
+            Callable taking a base64 audio payload and returning the JSON text frame
+        """
+        def encode(audio_payload: str) -> str:
+            return orjson.dumps(self.build_audio_message(stream_id, audio_payload)).decode()
+
+        return encode
+
     @abstractmethod
     def build_connection_response(
         self,
@@ -129,8 +180,17 @@ class DialerService(ABC):
 
     This is the primary interface that dialer plugins must implement.
     It combines audio conversion, message building, and connection handling.
+
+    A single instance per dialer is shared by every request and media stream
+    (see DialerRegistry.get_instance), so implementations and their components
+    must not keep per-call state on the instance.
     """
 
+    # Whether the dialer's media stream accepts raw audio in binary frames.
+    # When True, agent audio is sent with send_bytes() straight from
+    # AudioConverter.pcm_to_dialer_bytes(), bypassing the message builder.
+    supports_binary_media: bool = False
+
     def __init__(self):
         """Initialize dialer service with its components"""
         self.audio_converter: AudioConverter = self.get_audio_converter()
@@ -212,3 +272,68 @@ class DialerService(ABC):
             True if configuration is valid, False otherwise
         """
         pass
+
+
+async def relay_agent_audio(
+    messages: AsyncIterable[Any],
+    handle_message: Callable[[Any, bytearray], Awaitable[Optional[bytes]]],
+    send_audio: Callable[[bytes], Awaitable[None]]
+) -> None:
+    """
+    Coalesce agent audio into dialer media messages
+
+    Audio chunks smaller than DIALER_AUDIO_CHUNK_BYTES are batched into one
+    message. A partial batch is flushed as soon as the agent has been quiet
+    for DIALER_AUDIO_FLUSH_SECONDS, so the tail of an utterance is never held
+    back, and whatever is left is sent when messages ends.
+
+    Args:
+        messages: Agent messages or events
+        handle_message: Coroutine taking (message, pending_audio) and returning
+            the PCM it carries, or None for non-audio messages. It may clear
+            pending_audio (e.g. when the caller interrupts the agent).
+        send_audio: Coroutine sending one batch of PCM. It may be given the
+            pending buffer itself, which is cleared once it returns.
+    """
+    messages = messages.__aiter__()
+    pending_audio = bytearray()
+    next_message = None
+
+    try:
+        while True:
+            if pending_audio:
+                # Wait briefly for more audio; flush the partial batch if none arrives
+                next_message = asyncio.ensure_future(messages.__anext__())
+                done, _ = await asyncio.wait({next_message}, timeout=DIALER_AUDIO_FLUSH_SECONDS)
+                if not done:
+                    await send_audio(pending_audio)
+                    pending_audio.clear()
+                try:
+                    message = await next_message
+                except StopAsyncIteration:
+                    break
+                finally:
+                    next_message = None
+            else:
+                try:
+                    message = await messages.__anext__()
+                except StopAsyncIteration:
+                    break
+
+            pcm_bytes = await handle_message(message, pending_audio)
+            if not pcm_bytes:
+                continue
+
+            if not pending_audio and len(pcm_bytes) >= DIALER_AUDIO_CHUNK_BYTES:
+                await send_audio(pcm_bytes)
+            else:
+                pending_audio += pcm_bytes
+                if len(pending_audio) >= DIALER_AUDIO_CHUNK_BYTES:
+                    await send_audio(pending_audio)
+                    pending_audio.clear()
+
+        if pending_audio:
+            await send_audio(pending_audio)
+    finally:
+        if next_message is not None:
+            next_message.cancel()
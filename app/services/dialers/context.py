@@ -2,15 +2,39 @@
 Context management utilities for dialer sessions
 
 Provides in-memory storage for call contexts. In production, consider using Redis.
+
+Contexts expire after CONTEXT_TTL_SECONDS and the store is capped at
+MAX_CALL_CONTEXTS entries, so a missed cleanup (e.g. a call that never
+reaches the media stream) cannot grow memory without bound.
 """
 
 import logging
-from typing import Dict, Optional
+import time
+from collections import OrderedDict
+from typing import Dict, Optional, Tuple
 
 logger = logging.getLogger(__name__)
 
-# In-memory storage for call contexts
-_call_contexts: Dict[str, Dict] = {}
+# How long a stored context stays valid, in seconds
+CONTEXT_TTL_SECONDS = 3600
+
+# Upper bound on stored contexts; the oldest entries are evicted first
+MAX_CALL_CONTEXTS = 10_000
+
+# In-memory storage for call contexts: call_id -> (expires_at, context)
+# Every entry shares the same TTL, so insertion order is also expiry order.
+# Only touched from the event loop thread, so no locking is needed.
+_call_contexts: "OrderedDict[str, Tuple[float, Dict]]" = OrderedDict()
+
+
+def _evict_expired(now: float) -> None:
+    """Drop expired contexts from the front of the store"""
+    while _call_contexts:
+        call_id, (expires_at, _) = next(iter(_call_contexts.items()))
+        if expires_at > now:
+            break
+        del _call_contexts[call_id]
+        logger.info(f"⌛ Expired context for call {call_id}")
 
 
 def store_call_context(call_id: str, context: Dict) -> None:
@@ -21,7 +45,16 @@ def store_call_context(call_id: str, context: Dict) -> None:
         call_id: Unique call identifier
         context: Context data to store
     """
-    _call_contexts[call_id] = context
+    now = time.monotonic()
+    _evict_expired(now)
+
+    _call_contexts[call_id] = (now + CONTEXT_TTL_SECONDS, context)
+    _call_contexts.move_to_end(call_id)
+
+    while len(_call_contexts) > MAX_CALL_CONTEXTS:
+        evicted_id, _ = _call_contexts.popitem(last=False)
+        logger.warning(f"🗑️ Context store full, evicted call {evicted_id}")
+
     logger.info(f"📦 Stored context for call {call_id}")
 
 
@@ -33,9 +66,17 @@ def get_call_context(call_id: str) -> Optional[Dict]:
         call_id: Unique call identifier
 
     Returns:
-        Context dict if found, None otherwise
+        Context dict if found and not expired, None otherwise
     """
-    context = _call_contexts.get(call_id)
+    entry = _call_contexts.get(call_id)
+    context = None
+
+    if entry:
+        expires_at, context = entry
+        if expires_at <= time.monotonic():
+            del _call_contexts[call_id]
+            context = None
+
     if context:
         logger.debug(f"📦 Retrieved context for call {call_id}")
     else:
@@ -50,8 +91,7 @@ def cleanup_call_context(call_id: str) -> None:
     Args:
         call_id: Unique call identifier
     """
-    if call_id in _call_contexts:
-        del _call_contexts[call_id]
+    if _call_contexts.pop(call_id, None) is not None:
         logger.info(f"🗑️ Cleaned up context for call {call_id}")
 
 
@@ -68,4 +108,5 @@ def get_all_context_ids() -> list:
     Returns:
         List of call IDs
     """
+    _evict_expired(time.monotonic())
     return list(_call_contexts.keys())
@@ -15,6 +15,7 @@ class DialerRegistry:
     """Registry for dialer plugins"""
 
     _dialers: Dict[str, Type[DialerService]] = {}
+    _instances: Dict[str, DialerService] = {}
 
     @classmethod
     def register(cls, name: str, dialer_class: Type[DialerService]) -> None:
@@ -39,6 +40,7 @@ class DialerRegistry:
             )
 
         cls._dialers[name_lower] = dialer_class
+        cls._instances.pop(name_lower, None)
         logger.info(f"Registered dialer: {name}")
 
     @classmethod
@@ -65,6 +67,32 @@ class DialerRegistry:
 
         return cls._dialers[name_lower]
 
+    @classmethod
+    def get_instance(cls, name: str) -> DialerService:
+        """
+        Get the shared dialer service instance by name
+
+        Dialer services are stateless, so one instance per dialer is created
+        on first use and reused for every request and connection.
+
+        Args:
+            name: Dialer name (case-insensitive)
+
+        Returns:
+            DialerService instance
+
+        Raises:
+            ValueError: If dialer not found
+        """
+        name_lower = name.lower()
+
+        instance = cls._instances.get(name_lower)
+        if instance is None:
+            instance = cls.get(name_lower)()
+            cls._instances[name_lower] = instance
+
+        return instance
+
     @classmethod
     def list_dialers(cls) -> List[str]:
         """
@@ -105,10 +133,12 @@ class DialerRegistry:
             raise ValueError(f"Dialer '{name}' not registered")
 
         del cls._dialers[name_lower]
+        cls._instances.pop(name_lower, None)
         logger.info(f"Unregistered dialer: {name}")
 
     @classmethod
     def clear(cls) -> None:
         """Clear all registered dialers (useful for testing)"""
         cls._dialers.clear()
+        cls._instances.clear()
         logger.info("Cleared all registered dialers")
@@ -4,8 +4,8 @@ Twilio audio converter implementation
 Converts between Twilio's mu-law 8kHz format and ElevenLabs PCM 16kHz format.
 """
 
-import base64
 import audioop
+import binascii
 from app.services.dialers.base import AudioConverter
 
 
@@ -27,8 +27,8 @@ class TwilioAudioConverter(AudioConverter):
         Returns:
             PCM 16kHz audio bytes
         """
-        # Decode base64
-        mulaw_data = base64.b64decode(audio_data)
+        # Decode base64 (binascii directly; base64.b64decode is a Python wrapper around it)
+        mulaw_data = binascii.a2b_base64(audio_data)
 
         # Convert mu-law to PCM (16-bit linear)
         pcm_8khz = audioop.ulaw2lin(mulaw_data, 2)
@@ -55,6 +55,21 @@ class TwilioAudioConverter(AudioConverter):
         Returns:
             Base64-encoded mu-law audio for Twilio
         """
+        mulaw_data = self.pcm_to_dialer_bytes(pcm_data)
+
+        # Encode to base64 (ASCII output, so the ascii codec is the cheapest decode)
+        return binascii.b2a_base64(mulaw_data, newline=False).decode('ascii')
+
+    def pcm_to_dialer_bytes(self, pcm_data: bytes) -> bytes:
+        """
+        Convert PCM 16kHz from ElevenLabs to raw Twilio mu-law 8kHz
+
+        Args:
+            pcm_data: PCM 16kHz audio bytes from ElevenLabs
+
+        Returns:
+            Raw mu-law audio bytes
+        """
         # Resample from 16kHz to 8kHz
         pcm_8khz, _ = audioop.ratecv(
             pcm_data,
@@ -66,7 +81,4 @@ class TwilioAudioConverter(AudioConverter):
         )
 
         # Convert PCM to mu-law
-        mulaw_data = audioop.lin2ulaw(pcm_8khz, 2)
-
-        # Encode to base64
-        return base64.b64encode(mulaw_data).decode('utf-8')
+        return audioop.lin2ulaw(pcm_8khz, 2)
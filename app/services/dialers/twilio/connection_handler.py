@@ -39,22 +39,18 @@ class TwilioConnectionHandler(ConnectionHandler):
         """
         event_type = message.get("event")
 
+        handler = self._EVENT_HANDLERS.get(event_type)
+        if handler:
+            return handler(self, message)
+
         if event_type == "start":
             return await self._handle_start(message)
-        elif event_type == "media":
-            return self._handle_media(message)
-        elif event_type == "stop":
-            return self._handle_stop(message)
-        elif event_type == "mark":
-            return self._handle_mark(message)
-        elif event_type == "dtmf":
-            return self._handle_dtmf(message)
-        else:
-            # Unknown event type
-            return {
-                "event_type": "unknown",
-                "raw_message": message
-            }
+
+        # Unknown event type
+        return {
+            "event_type": "unknown",
+            "raw_message": message
+        }
 
     async def _handle_start(self, message: Dict) -> Dict[str, Any]:
         """Handle start event"""
@@ -134,3 +130,11 @@ class TwilioConnectionHandler(ConnectionHandler):
             "tracks": start_data.get("tracks", []),
             "media_format": start_data.get("media_format", {})
         }
+
+    # Synchronous event parsers by Twilio event name ("start" is async and handled inline)
+    _EVENT_HANDLERS = {
+        "media": _handle_media,
+        "stop": _handle_stop,
+        "mark": _handle_mark,
+        "dtmf": _handle_dtmf,
+    }
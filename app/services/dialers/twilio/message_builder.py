@@ -4,7 +4,9 @@ Twilio message builder implementation
 Builds Twilio-specific messages for WebSocket and TwiML.
 """
 
-from typing import Dict, Optional
+from typing import Callable, Dict, Optional
+from xml.sax.saxutils import quoteattr
+import orjson
 from app.services.dialers.base import MessageBuilder
 
 
@@ -34,6 +36,27 @@ class TwilioMessageBuilder(MessageBuilder):
             }
         }
 
+    def build_audio_frame_encoder(self, stream_id: str) -> Callable[[str], str]:
+        """
+        Build a media frame encoder with the envelope precomputed for the stream
+
+        Only the payload changes between frames, and base64 never needs JSON
+        escaping, so each frame is a plain string concatenation.
+
+        Args:
+            stream_id: Twilio stream identifier
+
+        Returns:
+            Callable taking base64 mu-law audio and returning the media message JSON
+        """
+        prefix = '{"event":"media","streamSid":' + orjson.dumps(stream_id).decode() + ',"media":{"payload":"'
+        suffix = '"}}'
+
+        def encode(audio_payload: str) -> str:
+            return prefix + audio_payload + suffix
+
+        return encode
+
     def build_connection_response(
         self,
         websocket_url: str,
@@ -56,7 +79,7 @@ class TwilioMessageBuilder(MessageBuilder):
                 # Convert boolean to string
                 if isinstance(value, bool):
                     value = "true" if value else "false"
-                parameters_xml += f'<Parameter name="{key}" value="{value}" />\n            '
+                parameters_xml += f'<Parameter name={quoteattr(key)} value={quoteattr(str(value))} />\n            '
 
         # Remove trailing whitespace if no parameters
         if parameters_xml:
@@ -66,7 +89,7 @@ class TwilioMessageBuilder(MessageBuilder):
         twiml = f'''<?xml version="1.0" encoding="UTF-8"?>
 <Response>
     <Connect>
-        <Stream url="{websocket_url}">{parameters_xml}
+        <Stream url={quoteattr(websocket_url)}>{parameters_xml}
         </Stream>
     </Connect>
 </Response>'''
@@ -4,7 +4,9 @@ Twilio dialer service implementation
 Main service class combining all Twilio components.
 """
 
+import asyncio
 import logging
+from functools import lru_cache
 from typing import Dict
 from twilio.rest import Client
 from twilio.base.exceptions import TwilioRestException
@@ -23,6 +25,23 @@ from app.config import settings
 logger = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=1)
+def _get_twilio_client() -> Client:
+    """
+    Get the shared Twilio REST client
+
+    The client owns an HTTP session, so reusing it keeps connections to the
+    Twilio API alive across calls instead of a new TLS handshake per call.
+
+    It is shared by both routers and used from asyncio.to_thread() workers.
+    That is safe: each request builds its own Request and Response objects,
+    and the only state shared between threads is the requests Session. Its
+    urllib3 pool is thread-safe. Above the pool's 10 kept-alive connections,
+    extra concurrent calls open a connection that is discarded afterwards.
+    """
+    return Client(settings.twilio_account_sid, settings.twilio_auth_token)
+
+
 class TwilioDialerService(DialerService):
     """
     Twilio dialer service
@@ -65,8 +84,7 @@ class TwilioDialerService(DialerService):
             TwilioRestException: If Twilio API call fails
         """
         try:
-            # Initialize Twilio client
-            client = Client(settings.twilio_account_sid, settings.twilio_auth_token)
+            client = _get_twilio_client()
 
             # Build custom parameters for TwiML
             custom_params = {
@@ -84,8 +102,10 @@ class TwilioDialerService(DialerService):
             logger.info(f"📞 Initiating Twilio call to {to_number}")
             logger.info(f"📄 TwiML:\n{twiml}")
 
-            # Make outbound call
-            call = client.calls.create(
+            # Make outbound call. The Twilio SDK is blocking, so run it in a
+            # worker thread to keep the event loop serving media streams.
+            call = await asyncio.to_thread(
+                client.calls.create,
                 from_=settings.twilio_phone_number,
                 to=to_number,
                 twiml=twiml
@@ -1,10 +1,14 @@
 import audioop
-import base64
+import binascii
 import logging
-from typing import Dict, Optional
+from typing import Callable, Dict
+from app.services.dialers.twilio.message_builder import TwilioMessageBuilder as DialerMessageBuilder
 
 logger = logging.getLogger(__name__)
 
+# The builder is stateless, so one instance serves every stream
+_DIALER_MESSAGE_BUILDER = DialerMessageBuilder()
+
 
 class TwilioAudioConverter:
     """Handles audio conversion between Twilio (mu-law 8kHz) and ElevenLabs (PCM 16kHz)"""
@@ -21,8 +25,8 @@ class TwilioAudioConverter:
             PCM 16kHz audio bytes suitable for ElevenLabs
         """
         try:
-            # Decode base64
-            mulaw_data = base64.b64decode(mulaw_base64)
+            # Decode base64 (binascii directly; base64.b64decode is a Python wrapper around it)
+            mulaw_data = binascii.a2b_base64(mulaw_base64)
 
             # mu-law to linear PCM (16-bit)
             pcm_8khz = audioop.ulaw2lin(mulaw_data, 2)
@@ -68,8 +72,8 @@ class TwilioAudioConverter:
             # Linear PCM to mu-law
             mulaw_data = audioop.lin2ulaw(pcm_8khz, 2)
 
-            # Encode to base64
-            return base64.b64encode(mulaw_data).decode('utf-8')
+            # Encode to base64 (ASCII output, so the ascii codec is the cheapest decode)
+            return binascii.b2a_base64(mulaw_data, newline=False).decode('ascii')
 
         except Exception as e:
             logger.error(f"Error converting PCM to mu-law: {e}")
@@ -99,6 +103,22 @@ class TwilioMessageBuilder:
             }
         }
 
+    @staticmethod
+    def build_media_frame_encoder(stream_sid: str) -> Callable[[str], str]:
+        """
+        Build an encoder for Twilio media messages on one stream
+
+        Delegates to the generic Twilio dialer's message builder, so both
+        routers send identical media frames.
+
+        Args:
+            stream_sid: Twilio stream identifier
+
+        Returns:
+            Callable taking base64 mu-law audio and returning the media message JSON
+        """
+        return _DIALER_MESSAGE_BUILDER.build_audio_frame_encoder(stream_sid)
+
     @staticmethod
     def build_mark_message(stream_sid: str, mark_name: str) -> Dict:
         """
@@ -119,42 +139,3 @@ class TwilioMessageBuilder:
             }
         }
 
-
-def generate_twiml_response(websocket_url: str) -> str:
-    """
-    Generate TwiML response to start media streaming
-
-    Args:
-        websocket_url: WebSocket URL for Twilio to connect to
-
-    Returns:
-        TwiML XML string
-    """
-    return f'''<?xml version="1.0" encoding="UTF-8"?>
-<Response>
-    <Connect>
-        <Stream url="{websocket_url}" />
-    </Connect>
-</Response>'''
-
-
-# In-memory storage for call contexts (use Redis in production)
-call_contexts: Dict[str, Dict] = {}
-
-
-def store_call_context(call_sid: str, context: Dict) -> None:
-    """Store context for a call session"""
-    call_contexts[call_sid] = context
-    logger.info(f"Stored context for call {call_sid}")
-
-
-def get_call_context(call_sid: str) -> Optional[Dict]:
-    """Retrieve context for a call session"""
-    return call_contexts.get(call_sid)
-
-
-def cleanup_call_context(call_sid: str) -> None:
-    """Remove context for a call session"""
-    if call_sid in call_contexts:
-        del call_contexts[call_sid]
-        logger.info(f"Cleaned up context for call {call_sid}")
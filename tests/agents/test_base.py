@@ -0,0 +1,31 @@
+import httpx
+import pytest
+
+from app.services.agents import base
+from app.services.agents.elevenlabs.service import ElevenLabsAgentService
+
+
+class TestAgentServiceHttpClient:
+    @pytest.mark.asyncio
+    async def test_client_is_built_and_reused(self):
+        service = ElevenLabsAgentService()
+
+        client = service._get_http_client()
+
+        assert isinstance(client, httpx.AsyncClient)
+        assert service._get_http_client() is client
+
+        await service.aclose()
+        assert client.is_closed
+        assert service._http_client is None
+
+    @pytest.mark.asyncio
+    async def test_falls_back_to_http1_without_h2(self, monkeypatch):
+        monkeypatch.setattr(base, "HTTP2_AVAILABLE", False)
+        service = ElevenLabsAgentService()
+
+        # Must not raise ImportError when h2 is not installed
+        client = service._get_http_client()
+
+        assert isinstance(client, httpx.AsyncClient)
+        await service.aclose()
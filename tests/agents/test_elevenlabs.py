@@ -0,0 +1,132 @@
+import asyncio
+import base64
+
+import orjson
+import pytest
+
+from app.routers.dialer import AGENT_AUDIO_FRAMES_PER_CHUNK
+from app.services.agents.elevenlabs import service as elevenlabs_service
+from app.services.agents.elevenlabs.message_handler import ElevenLabsMessageHandler
+from app.services.agents.elevenlabs.service import ElevenLabsAgentService, SIGNED_URL_TTL_SECONDS
+from app.services.dialers.twilio.audio_converter import TwilioAudioConverter
+
+# 20ms of mu-law silence, as Twilio sends it
+TWILIO_SILENT_FRAME = base64.b64encode(b"\xff" * 160).decode()
+
+
+class TestElevenLabsMessageHandler:
+    def test_silent_router_chunk_uses_cached_message(self):
+        handler = ElevenLabsMessageHandler()
+        # One caller batch as media_stream builds it from Twilio frames
+        converter = TwilioAudioConverter()
+        chunk = bytearray()
+        for _ in range(AGENT_AUDIO_FRAMES_PER_CHUNK):
+            chunk += converter.dialer_to_pcm(TWILIO_SILENT_FRAME)
+
+        first = handler.build_audio_message(chunk)
+        second = handler.build_audio_message(bytearray(chunk))
+
+        assert second is first
+        assert orjson.loads(first) == {"user_audio_chunk": base64.b64encode(chunk).decode()}
+
+    def test_non_silent_chunk_is_encoded(self):
+        handler = ElevenLabsMessageHandler()
+        silent = handler.build_audio_message(bytes(1276))
+
+        message = handler.build_audio_message(b"\x01" + bytes(1275))
+
+        assert message != silent
+        assert orjson.loads(message) == {
+            "user_audio_chunk": base64.b64encode(b"\x01" + bytes(1275)).decode()
+        }
+
+
+@pytest.fixture
+def service(monkeypatch):
+    """Service whose signed URL API and WebSocket connects are recorded, not performed"""
+    service = ElevenLabsAgentService()
+    service.url_requests = 0
+    service.connected = []
+    service.rejected_urls = set()
+
+    async def get_signed_url(agent_id):
+        service.url_requests += 1
+        # Yield once so concurrent callers can join the in-flight request
+        await asyncio.sleep(0)
+        return f"wss://signed/{agent_id}/{service.url_requests}"
+
+    async def connect(url):
+        if url in service.rejected_urls:
+            raise ConnectionError("HTTP 403")
+        service.connected.append(url)
+        return object()
+
+    monkeypatch.setattr(service, "_get_signed_url", get_signed_url)
+    monkeypatch.setattr(elevenlabs_service.websockets, "connect", connect)
+    return service
+
+
+class TestElevenLabsSignedUrlCache:
+    @pytest.mark.asyncio
+    async def test_fresh_cached_url_is_reused(self, service):
+        await service.open_websocket("agent_1")
+        await service.open_websocket("agent_1")
+
+        assert service.url_requests == 1
+        assert service.connected == ["wss://signed/agent_1/1"] * 2
+
+    @pytest.mark.asyncio
+    async def test_rejected_cached_url_falls_back_to_new_url(self, service):
+        await service.open_websocket("agent_1")
+        service.rejected_urls.add("wss://signed/agent_1/1")
+
+        await service.open_websocket("agent_1")
+
+        assert service.url_requests == 2
+        assert service.connected[-1] == "wss://signed/agent_1/2"
+        assert service._signed_urls["agent_1"][1] == "wss://signed/agent_1/2"
+
+    @pytest.mark.asyncio
+    async def test_expiry_is_not_extended_on_reuse(self, service, monkeypatch):
+        now = [1000.0]
+        monkeypatch.setattr(elevenlabs_service.time, "monotonic", lambda: now[0])
+
+        await service.open_websocket("agent_1")
+        now[0] += SIGNED_URL_TTL_SECONDS - 1
+        await service.open_websocket("agent_1")
+        now[0] += 1
+        await service.open_websocket("agent_1")
+
+        assert service.url_requests == 2
+
+    @pytest.mark.asyncio
+    async def test_concurrent_connects_share_one_request(self, service):
+        await asyncio.gather(*(service.open_websocket("agent_1") for _ in range(5)))
+
+        assert service.url_requests == 1
+        assert service.connected == ["wss://signed/agent_1/1"] * 5
+        assert service._signed_url_requests == {}
+
+    @pytest.mark.asyncio
+    async def test_cancelled_caller_does_not_cancel_shared_request(self, service):
+        first = asyncio.create_task(service.open_websocket("agent_1"))
+        second = asyncio.create_task(service.open_websocket("agent_1"))
+        await asyncio.sleep(0)
+        first.cancel()
+
+        await second
+
+        assert service.url_requests == 1
+        assert service.connected == ["wss://signed/agent_1/1"]
+
+    @pytest.mark.asyncio
+    async def test_deprecated_connect_agent_shares_service_cache(self, service, monkeypatch):
+        from app.services.agents.elevenlabs import elevenlabs_service as legacy
+        from app.services.agents.registry import AgentRegistry
+
+        monkeypatch.setattr(AgentRegistry, "get_instance", classmethod(lambda cls, name: service))
+
+        await legacy.connect_agent("agent_1")
+        await service.open_websocket("agent_1")
+
+        assert service.url_requests == 1
@@ -0,0 +1,72 @@
+import asyncio
+
+import pytest
+
+from app.services.dialers.base import DIALER_AUDIO_CHUNK_BYTES, relay_agent_audio
+
+
+async def _pcm(message, pending_audio):
+    return message
+
+
+async def _relay(messages, handle_message=_pcm):
+    sent = []
+
+    async def send_audio(pcm_bytes):
+        sent.append(bytes(pcm_bytes))
+
+    await asyncio.wait_for(relay_agent_audio(messages, handle_message, send_audio), timeout=1.0)
+    return sent
+
+
+class TestRelayAgentAudio:
+    @pytest.mark.asyncio
+    async def test_small_chunks_are_batched(self):
+        chunk = b"\x01" * (DIALER_AUDIO_CHUNK_BYTES // 2)
+
+        async def messages():
+            for _ in range(4):
+                yield chunk
+
+        assert await _relay(messages()) == [chunk * 2, chunk * 2]
+
+    @pytest.mark.asyncio
+    async def test_partial_batch_flushed_when_agent_goes_quiet(self):
+        resume = asyncio.Event()
+        sent = []
+
+        async def messages():
+            yield b"\x01" * 100
+            # Stays quiet until the first batch has gone out
+            await resume.wait()
+            yield b"\x02" * 100
+
+        async def send_audio(pcm_bytes):
+            sent.append(bytes(pcm_bytes))
+            resume.set()
+
+        await asyncio.wait_for(relay_agent_audio(messages(), _pcm, send_audio), timeout=1.0)
+
+        assert sent == [b"\x01" * 100, b"\x02" * 100]
+
+    @pytest.mark.asyncio
+    async def test_partial_batch_flushed_at_end_of_stream(self):
+        async def messages():
+            yield b"\x01" * 100
+            yield b"\x02" * 100
+
+        assert await _relay(messages()) == [b"\x01" * 100 + b"\x02" * 100]
+
+    @pytest.mark.asyncio
+    async def test_handler_can_discard_pending_audio(self):
+        async def messages():
+            yield b"\x01" * 100
+            yield None
+            yield b"\x02" * 100
+
+        async def handle_message(message, pending_audio):
+            if message is None:
+                pending_audio.clear()
+            return message
+
+        assert await _relay(messages(), handle_message) == [b"\x02" * 100]
@@ -0,0 +1,38 @@
+import pytest
+from app.services.dialers import context
+
+
+@pytest.fixture(autouse=True)
+def clean_store():
+    context.clear_all_contexts()
+    yield
+    context.clear_all_contexts()
+
+
+class TestCallContextStore:
+    def test_store_get_cleanup(self):
+        context.store_call_context("CA1", {"agent_id": "agent_1"})
+
+        assert context.get_call_context("CA1") == {"agent_id": "agent_1"}
+
+        context.cleanup_call_context("CA1")
+        assert context.get_call_context("CA1") is None
+
+    def test_expired_context_is_dropped(self, monkeypatch):
+        now = [1000.0]
+        monkeypatch.setattr(context.time, "monotonic", lambda: now[0])
+
+        context.store_call_context("CA1", {"agent_id": "agent_1"})
+        now[0] += context.CONTEXT_TTL_SECONDS
+
+        assert context.get_call_context("CA1") is None
+        assert context.get_all_context_ids() == []
+
+    def test_oldest_context_evicted_when_full(self, monkeypatch):
+        monkeypatch.setattr(context, "MAX_CALL_CONTEXTS", 2)
+
+        context.store_call_context("CA1", {})
+        context.store_call_context("CA2", {})
+        context.store_call_context("CA3", {})
+
+        assert context.get_all_context_ids() == ["CA2", "CA3"]
@@ -0,0 +1,152 @@
+import asyncio
+import audioop
+import base64
+
+import orjson
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.config import settings
+from app.routers import dialer as dialer_router
+from app.services.agents.base import AgentService, AgentStream
+from app.services.agents.registry import AgentRegistry
+from app.services.agents.types import AgentEvent, AgentEventTypes
+from app.services.dialers.base import relay_agent_audio
+from app.services.dialers.registry import DialerRegistry
+from app.services.dialers.twilio.audio_converter import TwilioAudioConverter
+from app.services.dialers.twilio.service import TwilioDialerService
+
+
+class FakeAgentStream(AgentStream):
+    """Records caller audio; yields no events until closed"""
+
+    def __init__(self):
+        self.sent = []
+        self.closed = asyncio.Event()
+
+    async def initialize(self):
+        pass
+
+    async def send_audio(self, audio_data):
+        self.sent.append(bytes(audio_data))
+
+    async def receive(self):
+        await self.closed.wait()
+        return
+        yield
+
+    async def close(self):
+        self.closed.set()
+
+
+class FakeAgentService(AgentService):
+    streams = []
+
+    def get_message_handler(self):
+        return None
+
+    async def connect(self, agent_id, dynamic_variables):
+        stream = FakeAgentStream()
+        self.streams.append(stream)
+        return stream
+
+    def get_agent_name(self):
+        return "fake"
+
+    def validate_config(self):
+        return True
+
+
+@pytest.fixture
+def client(monkeypatch):
+    FakeAgentService.streams = []
+    DialerRegistry.register("twilio", TwilioDialerService)
+    AgentRegistry.register("fake", FakeAgentService)
+    monkeypatch.setattr(settings, "default_agent", "fake")
+
+    app = FastAPI()
+    app.include_router(dialer_router.router)
+    yield TestClient(app)
+
+    AgentRegistry.unregister("fake")
+    DialerRegistry.unregister("twilio")
+
+
+def _twilio_frame(seq: int) -> bytes:
+    # 20ms of 8kHz mu-law, as Twilio sends it
+    pcm = b"".join(((seq * 160 + i) % 256 * 64).to_bytes(2, "little", signed=True) for i in range(160))
+    return base64.b64encode(audioop.lin2ulaw(pcm, 2))
+
+
+def _run_call(client, frame_count: int):
+    frames = [_twilio_frame(seq) for seq in range(frame_count)]
+
+    with client.websocket_connect("/twilio/media-stream") as ws:
+        ws.send_text(orjson.dumps({
+            "event": "start",
+            "start": {"callSid": "CA1", "streamSid": "MZ1", "customParameters": {"agent_id": "agent_1"}}
+        }).decode())
+        for frame in frames:
+            ws.send_text(orjson.dumps({"event": "media", "media": {"payload": frame.decode()}}).decode())
+        ws.send_text(orjson.dumps({"event": "stop", "stop": {"callSid": "CA1"}}).decode())
+        assert ws.receive()["type"] == "websocket.close"
+
+    converter = TwilioAudioConverter()
+    return [converter.dialer_to_pcm(frame.decode()) for frame in frames], FakeAgentService.streams[0].sent
+
+
+class TestCallerAudioBatching:
+    def test_each_batch_holds_two_twilio_frames(self, client):
+        pcm_frames, sent = _run_call(client, 4)
+
+        assert sent == [pcm_frames[0] + pcm_frames[1], pcm_frames[2] + pcm_frames[3]]
+
+    def test_partial_batch_sent_on_stop(self, client):
+        pcm_frames, sent = _run_call(client, 5)
+
+        assert sent[-1] == pcm_frames[4]
+        assert b"".join(sent) == b"".join(pcm_frames)
+
+
+class TestAgentSendQueue:
+    def test_full_queue_drops_oldest_audio(self):
+        send_queue = asyncio.Queue(maxsize=2)
+
+        for pcm_audio in (b"1", b"2", b"3"):
+            dialer_router.queue_agent_audio(send_queue, pcm_audio)
+
+        assert [send_queue.get_nowait() for _ in range(2)] == [b"2", b"3"]
+
+
+class TestAgentAudioToDialer:
+    @pytest.mark.asyncio
+    async def test_interruption_discards_pending_audio(self):
+        sent = []
+
+        async def events():
+            yield AgentEvent(type=AgentEventTypes.AUDIO, data=b"\x01" * 100)
+            yield AgentEvent(type=AgentEventTypes.INTERRUPTION, data=None)
+            yield AgentEvent(type=AgentEventTypes.AUDIO, data=b"\x02" * 100)
+
+        async def send_audio(pcm_bytes):
+            sent.append(bytes(pcm_bytes))
+
+        await relay_agent_audio(events(), dialer_router._handle_agent_event, send_audio)
+
+        assert sent == [b"\x02" * 100]
+
+
+class TestOutboundCall:
+    def test_null_metadata_is_not_a_validation_error(self, client, monkeypatch):
+        monkeypatch.setattr(TwilioDialerService, "validate_config", lambda self: True)
+
+        response = client.post(
+            "/twilio/outbound-call",
+            json={"agent_id": "agent_1", "metadata": None},
+            headers={"X-API-Key": next(iter(settings.allowed_api_keys))}
+        )
+
+        # Accepted by the model; rejected only for the missing number
+        assert response.status_code == 400
+        assert response.json()["detail"] == "to_number is required in metadata"
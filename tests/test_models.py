@@ -0,0 +1,18 @@
+from app.models import InitiateCallRequest
+
+
+class TestInitiateCallRequest:
+    def test_null_metadata_is_empty(self):
+        request = InitiateCallRequest.model_validate({"agent_id": "agent_1", "metadata": None})
+
+        assert request.metadata.to_number is None
+        assert request.metadata.dynamic_variables == {}
+
+    def test_numeric_to_number_and_null_dynamic_variables(self):
+        request = InitiateCallRequest.model_validate({
+            "agent_id": "agent_1",
+            "metadata": {"to_number": 919876543210, "dynamic_variables": None}
+        })
+
+        assert request.metadata.to_number == "919876543210"
+        assert request.metadata.dynamic_variables == {}